@@ -1,6 +1,11 @@
 """Enum definitions for scenario configuration."""
 
+import bisect
+import itertools
+import os
+import random
 from enum import Enum
+from typing import NamedTuple
 
 
 class BizType(str, Enum):
@@ -9,6 +14,17 @@ class BizType(str, Enum):
     NON_BIZ = "non_biz"  # 비사업자
     CORP = "corp"  # 법인
 
+    @classmethod
+    def from_value(cls, value: str) -> "BizType":
+        """값 문자열로 멤버 조회 (Enum.__call__ 대비 단일 dict 조회)"""
+        try:
+            return _BIZ_TYPE_BY_VALUE[value]
+        except KeyError:
+            raise ValueError(f"{value!r} is not a valid {cls.__name__}") from None
+
+
+_BIZ_TYPE_BY_VALUE: dict[str, BizType] = {e.value: e for e in BizType}
+
 
 class CorpType(str, Enum):
     """법인 유형 (샘플 데이터 기반)"""
@@ -36,6 +52,17 @@ class LoginMethod(str, Enum):
     CORP_COMMON_CERT = "corp_common_cert"  # 공동인증서
     CORP_ID_PW = "corp_id_pw"  # ID/PW
 
+    @classmethod
+    def from_value(cls, value: str) -> "LoginMethod":
+        """값 문자열로 멤버 조회 (Enum.__call__ 대비 단일 dict 조회)"""
+        try:
+            return _LOGIN_METHOD_BY_VALUE[value]
+        except KeyError:
+            raise ValueError(f"{value!r} is not a valid {cls.__name__}") from None
+
+
+_LOGIN_METHOD_BY_VALUE: dict[str, LoginMethod] = {e.value: e for e in LoginMethod}
+
 
 class ErrorType(str, Enum):
     """에러 타입 (샘플 데이터 기반 - 빈도순)"""
@@ -137,17 +164,19 @@ ERROR_DEFAULT_ACTION: dict[ErrorType, ActionType] = {
 }
 
 
+# 귀속연도는 프로세스 시작 시점에만 바뀌므로 import 시 한 번만 읽음
+_MODEL_YEAR = os.environ.get("MOCK_ITR_MODEL_YEAR", "2024")
+
+# 기환급자(환경변수 귀속연도)까지 반영한 최종 메시지 테이블 (import 시 1회 구성)
+_RESOLVED_ERROR_MESSAGES: dict[ErrorType, str] = {
+    **ERROR_MESSAGES,
+    ErrorType.ALREADY_REFUNDED: _MODEL_YEAR,
+}
+
+
 def get_error_message(error_type: ErrorType) -> str:
     """에러 타입에 따른 메시지 반환 (환경변수 고려)"""
-    import os
-    
-    # 기환급자 에러는 환경변수에서 귀속연도를 가져옴
-    if error_type == ErrorType.ALREADY_REFUNDED:
-        model_year = os.environ.get("MOCK_ITR_MODEL_YEAR", "2024")
-        return model_year
-    
-    # 나머지는 기본 메시지 사용
-    return ERROR_MESSAGES.get(error_type, "알 수 없는 오류가 발생했습니다.")
+    return _RESOLVED_ERROR_MESSAGES.get(error_type, "알 수 없는 오류가 발생했습니다.")
 
 
 # 에러 빈도 통계 (샘플 데이터 기반)
@@ -160,3 +189,67 @@ ERROR_FREQUENCY: dict[ErrorType, int] = {
     ErrorType.NO_CONT_BIZ: 1,
     ErrorType.CALC_ERROR: 1,
 }
+
+# 빈도 가중 샘플링용 사전 계산 테이블 (import 시 1회 구성)
+_ERROR_TYPES: tuple[ErrorType, ...] = tuple(ERROR_FREQUENCY)
+_ERROR_CUMWEIGHTS: tuple[int, ...] = tuple(itertools.accumulate(ERROR_FREQUENCY.values()))
+
+
+def sample_error_type(rng: random.Random | None = None) -> ErrorType:
+    """샘플 데이터 빈도에 비례해 에러 타입을 추출"""
+    rnd = rng.random() if rng is not None else random.random()
+    return _ERROR_TYPES[bisect.bisect(_ERROR_CUMWEIGHTS, rnd * _ERROR_CUMWEIGHTS[-1])]
+
+
+# 대체 메시지별 빈도 (샘플 데이터 건수, ERROR_MESSAGES_ALT와 같은 순서)
+ERROR_MESSAGES_ALT_WEIGHTS: dict[ErrorType, list[int]] = {
+    ErrorType.NO_BIZ: [10140, 3277, 2915],
+    ErrorType.SESSION_EXPIRED: [69, 17, 7, 6, 5, 2],
+}
+
+# 대체 메시지 샘플링 테이블: (메시지 튜플, 누적 가중치 튜플) - import 시 1회 구성
+_ALT_SAMPLERS: dict[ErrorType, tuple[tuple[str, ...], tuple[int, ...]]] = {
+    et: (
+        tuple(msgs),
+        tuple(itertools.accumulate(ERROR_MESSAGES_ALT_WEIGHTS.get(et, [1] * len(msgs)))),
+    )
+    for et, msgs in ERROR_MESSAGES_ALT.items()
+}
+
+
+def pick_alt_message(error_type: ErrorType, rng: random.Random | None = None) -> str:
+    """대체 메시지를 샘플 데이터 빈도에 비례해 추출 (변형이 없으면 기본 메시지)"""
+    sampler = _ALT_SAMPLERS.get(error_type)
+    if sampler is None:
+        return get_error_message(error_type)
+    messages, cumweights = sampler
+    rnd = rng.random() if rng is not None else random.random()
+    return messages[bisect.bisect(cumweights, rnd * cumweights[-1])]
+
+
+class ErrorInfo(NamedTuple):
+    """에러 타입별 부가 정보 (메시지/변형 메시지/기본 액션/빈도)"""
+    message: str
+    alt_messages: tuple[str, ...]
+    default_action: ActionType
+    frequency: int
+
+
+# 네 개의 ErrorType 키 사전을 서수 인덱스 플랫 테이블로 통합 (조회 1회로 전체 레코드 획득)
+for _i, _member in enumerate(ErrorType):
+    _member._ord_ = _i
+
+_ERROR_TABLE: tuple[ErrorInfo, ...] = tuple(
+    ErrorInfo(
+        message=get_error_message(m),
+        alt_messages=tuple(ERROR_MESSAGES_ALT.get(m, ())),
+        default_action=ERROR_DEFAULT_ACTION.get(m, ActionType.LOAD),
+        frequency=ERROR_FREQUENCY.get(m, 0),
+    )
+    for m in ErrorType
+)
+
+
+def get_error_info(error_type: ErrorType) -> ErrorInfo:
+    """에러 타입의 전체 레코드 반환 (사전 해싱 없이 배열 인덱싱)"""
+    return _ERROR_TABLE[error_type._ord_]
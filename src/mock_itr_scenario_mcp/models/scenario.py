@@ -1,7 +1,10 @@
 """Scenario configuration models."""
 
 from typing import Any
-from pydantic import BaseModel, ConfigDict, Field
+
+import orjson
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+from pydantic.dataclasses import dataclass as pydantic_dataclass
 
 from .enums import BizType, CertType
 
@@ -13,6 +16,8 @@ class UserInfo(BaseModel):
     birthday: str = Field(default="19900101", description="생년월일 (YYYYMMDD)")
     cert_type: str | None = Field(default=None, description="간편인증 유형 (cert_request에서 사용)")
 
+    model_config = ConfigDict(frozen=True)
+
 
 class TaxpayerInfo(BaseModel):
     """납세자 정보"""
@@ -20,6 +25,8 @@ class TaxpayerInfo(BaseModel):
     tax_office_code: str = Field(default="123", description="관할세무서코드")
     tax_office_name: str = Field(default="강남세무서", description="관할세무서명")
 
+    model_config = ConfigDict(frozen=True)
+
 
 def get_default_model_year() -> str:
     """환경변수에서 귀속연도 가져오기 (기본값: 2024)"""
@@ -32,6 +39,8 @@ class MetaInfo(BaseModel):
     client_id: str = Field(default="bznav-refund-mock", description="클라이언트 ID")
     model_year: str = Field(default_factory=get_default_model_year, description="귀속연도")
 
+    model_config = ConfigDict(frozen=True)
+
 
 class CertInfo(BaseModel):
     """인증 정보"""
@@ -41,6 +50,8 @@ class CertInfo(BaseModel):
     token: str = Field(default="", description="인증 토큰")
     cx_id: str = Field(default="", description="CX ID")
 
+    model_config = ConfigDict(frozen=True)
+
 
 class CommonCert(BaseModel):
     """공동인증서 정보"""
@@ -48,17 +59,30 @@ class CommonCert(BaseModel):
     sign_pri: str = Field(default="", description="공동인증서 개인키 (base64)")
     sign_pw: str = Field(default="", description="공동인증서 비밀번호")
 
+    model_config = ConfigDict(frozen=True)
+
 
 class Cookies(BaseModel):
     """쿠키 정보"""
     nts_login_system_code_p: str = Field(default="TXPP", description="NTS 로그인 시스템 코드")
     txpp_session_id: str = Field(default="", description="TXPP 세션 ID")
 
+    model_config = ConfigDict(frozen=True)
+
 
 # ============================================================================
 # 액션별 요청/응답 데이터 모델
 # ============================================================================
 
+class ErrorEnvelope(BaseModel):
+    """응답 공통 에러 정보"""
+    status: bool = Field(default=False, description="에러 발생 여부")
+    type: str = Field(default="", description="에러 타입")
+    msg: str = Field(default="", description="에러 메시지")
+
+    model_config = ConfigDict(frozen=True)
+
+
 class CertRequestRequest(BaseModel):
     """cert_request 요청 데이터"""
     action: str = Field(default="cert_request", description="액션 타입")
@@ -68,7 +92,7 @@ class CertRequestRequest(BaseModel):
 
 class CertRequestResponse(BaseModel):
     """cert_request 응답 데이터"""
-    error: dict[str, Any] = Field(default_factory=lambda: {"status": False, "type": "", "msg": ""})
+    error: ErrorEnvelope = Field(default_factory=ErrorEnvelope)
     result: dict[str, str] = Field(default_factory=dict, description="reqTxId, token, cxId")
 
 
@@ -82,7 +106,7 @@ class CertResponseRequest(BaseModel):
 
 class CertResponseResponse(BaseModel):
     """cert_response 응답 데이터"""
-    error: dict[str, Any] = Field(default_factory=lambda: {"status": False, "type": "", "msg": ""})
+    error: ErrorEnvelope = Field(default_factory=ErrorEnvelope)
     result: dict[str, str] = Field(default_factory=dict, description="token 등 인증 결과")
 
 
@@ -99,7 +123,7 @@ class CheckRequest(BaseModel):
 
 class CheckResponse(BaseModel):
     """check 응답 데이터"""
-    error: dict[str, Any] = Field(default_factory=lambda: {"status": False, "type": "", "msg": ""})
+    error: ErrorEnvelope = Field(default_factory=ErrorEnvelope)
     result: dict[str, Any] = Field(default_factory=dict, description="tin, cookies")
 
 
@@ -121,7 +145,7 @@ class LoadRequest(BaseModel):
 
 class LoadResponse(BaseModel):
     """load 응답 데이터"""
-    error: dict[str, Any] = Field(default_factory=lambda: {"status": False, "type": "", "msg": ""})
+    error: ErrorEnvelope = Field(default_factory=ErrorEnvelope)
     result: dict[str, Any] = Field(default_factory=dict, description="수집/계산 결과 데이터")
 
 
@@ -137,7 +161,7 @@ class CalcRequest(BaseModel):
 
 class CalcResponse(BaseModel):
     """calc 응답 데이터"""
-    error: dict[str, Any] = Field(default_factory=lambda: {"status": False, "type": "", "msg": ""})
+    error: ErrorEnvelope = Field(default_factory=ErrorEnvelope)
     result: dict[str, Any] = Field(default_factory=dict, description="계산 결과 데이터")
 
 
@@ -154,7 +178,7 @@ class CorpCheckRequest(BaseModel):
 
 class CorpCheckResponse(BaseModel):
     """corp_check 응답 데이터"""
-    error: dict[str, Any] = Field(default_factory=lambda: {"status": False, "type": "", "msg": ""})
+    error: ErrorEnvelope = Field(default_factory=ErrorEnvelope)
     result: dict[str, Any] = Field(default_factory=dict, description="법인 정보 (구분, 사업체명, 사업자번호, 대표자명, tin, cookies)")
 
 
@@ -170,7 +194,7 @@ class CorpLoadCalcRequest(BaseModel):
 
 class CorpLoadCalcResponse(BaseModel):
     """corp_load_calc 응답 데이터"""
-    error: dict[str, Any] = Field(default_factory=lambda: {"status": False, "type": "", "msg": ""})
+    error: ErrorEnvelope = Field(default_factory=ErrorEnvelope)
     result: dict[str, Any] = Field(default_factory=dict, description="법인 수집/계산 결과 데이터")
 
 
@@ -184,8 +208,11 @@ class ActionConfig(BaseModel):
     request_data: dict[str, Any] | None = Field(default=None, description="요청 데이터 (액션별 요청 모델 구조)")
     response_data: dict[str, Any] | None = Field(default=None, description="응답 데이터 (액션별 응답 모델 구조)")
 
+    model_config = ConfigDict(frozen=True)
 
-class ProgressStep(BaseModel):
+
+@pydantic_dataclass(slots=True, frozen=True)
+class ProgressStep:
     """진행률 단계"""
     step_name: str = Field(description="단계 이름")
     progress: str = Field(description="진행률 (예: '20%')")
@@ -198,14 +225,18 @@ class ProgressConfig(BaseModel):
     queue_name: str = Field(default="refund-search.fifo", description="SQS 큐 이름")
     steps: list[ProgressStep] = Field(default_factory=list, description="진행률 단계")
 
+    model_config = ConfigDict(frozen=True)
+
 
-class RefundItem(BaseModel):
+@pydantic_dataclass(slots=True, frozen=True)
+class RefundItem:
     """환급 항목"""
     name: str = Field(description="항목명")
     amount: int = Field(default=0, description="금액")
 
 
-class BizLocation(BaseModel):
+@pydantic_dataclass(slots=True, frozen=True)
+class BizLocation:
     """사업장 정보"""
     biz_no: str = Field(default="", description="사업자번호")
     biz_name: str = Field(default="", description="상호")
@@ -219,13 +250,13 @@ class RefundResult(BaseModel):
     biz_locations: list[BizLocation] = Field(default_factory=list, description="사업장 목록")
     
     # 세부 환급 항목 (레거시 호환)
-    창중감_환급액: int = Field(default=0, alias="창중감_환급액")
-    고용증대_환급액: int = Field(default=0, alias="고용증대_환급액")
-    사회보험료_환급액: int = Field(default=0, alias="사회보험료_환급액")
-    중소기업특별세액_환급액: int = Field(default=0, alias="중소기업특별세액_환급액")
-    양도세_환급액: int = Field(default=0, alias="양도세_환급액")
-    
-    model_config = ConfigDict(populate_by_name=True)
+    창중감_환급액: int = 0
+    고용증대_환급액: int = 0
+    사회보험료_환급액: int = 0
+    중소기업특별세액_환급액: int = 0
+    양도세_환급액: int = 0
+
+    model_config = ConfigDict(frozen=True)
 
 
 class VersionInfo(BaseModel):
@@ -233,6 +264,8 @@ class VersionInfo(BaseModel):
     gcexcel_version: str = Field(default="1.0.0", description="GCExcel 버전")
     itrloader_version: str = Field(default="1.0.0", description="ItrLoader 버전")
 
+    model_config = ConfigDict(frozen=True)
+
 
 class ScenarioConfig(BaseModel):
     """시나리오 설정"""
@@ -265,10 +298,21 @@ class ScenarioConfig(BaseModel):
     
     # 진행률 설정
     progress_config: ProgressConfig = Field(default_factory=ProgressConfig, description="진행률 설정")
-    
+
+    model_config = ConfigDict(frozen=True)
+
+    # to_dict 캐시 (불변이므로 무효화 불필요)
+    _dict_cache: dict[str, Any] | None = PrivateAttr(default=None)
+
     def to_dict(self) -> dict[str, Any]:
-        """딕셔너리로 변환"""
-        return self.model_dump(by_alias=True, exclude_none=True)
+        """딕셔너리로 변환 (같은 인스턴스 재호출 시 캐시 재사용)"""
+        if self._dict_cache is None:
+            self._dict_cache = self.model_dump(by_alias=True, exclude_none=True)
+        return self._dict_cache
+
+    def to_json_bytes(self) -> bytes:
+        """UTF-8 JSON 바이트로 직렬화 (stdlib json 대비 C 레벨 인코딩)"""
+        return orjson.dumps(self.to_dict(), option=orjson.OPT_NON_STR_KEYS)
     
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "ScenarioConfig":
@@ -1,51 +1,41 @@
 """MCP Server for Mock ITR Scenario management."""
 
 import asyncio
-import json
+import functools
 import logging
 import os
+import re
 import uuid
 from datetime import datetime, timezone
 from decimal import Decimal
+from operator import itemgetter
 from pathlib import Path
+from collections.abc import Awaitable, Callable
 from typing import Any
 
+import boto3
+import orjson
+from botocore.config import Config as BotoConfig
+from pydantic import BaseModel
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import (
     Tool,
     TextContent,
     Resource,
-    ResourceTemplate,
 )
 
-from .models.enums import BizType, CertType, ErrorType, ERROR_MESSAGES, ERROR_MESSAGES_ALT, ERROR_DEFAULT_ACTION, ActionType, CorpType, ProgressValue, ERROR_FREQUENCY, get_error_message, LoginMethod
+from .models.enums import BizType, CertType, ErrorType, ERROR_MESSAGES, ERROR_DEFAULT_ACTION, ActionType, get_error_info, get_error_message, LoginMethod
 from .models.scenario import (
     ScenarioConfig,
     UserInfo,
     TaxpayerInfo,
     RefundResult,
-    RefundItem,
-    BizLocation,
     ActionConfig,
     ProgressConfig,
     ProgressStep,
     CertInfo,
     CommonCert,
-    CertRequestRequest,
-    CertRequestResponse,
-    CertResponseRequest,
-    CertResponseResponse,
-    CheckRequest,
-    CheckResponse,
-    LoadRequest,
-    LoadResponse,
-    CalcRequest,
-    CalcResponse,
-    CorpCheckRequest,
-    CorpCheckResponse,
-    CorpLoadCalcRequest,
-    CorpLoadCalcResponse,
 )
 
 # Configure logging
@@ -55,10 +45,28 @@ logger = logging.getLogger(__name__)
 # Create MCP server instance
 server = Server("mock-itr-scenario")
 
-# Template storage (loaded from local templates directory)
-TEMPLATES: dict[str, dict[str, Any]] = {}
+# MCP 응답은 기계가 파싱하므로 기본은 압축 출력, 디버깅 시 MCP_PRETTY=1로 들여쓰기
+_DUMPS_OPTS = orjson.OPT_NON_STR_KEYS | (
+    orjson.OPT_INDENT_2 if os.environ.get("MCP_PRETTY") else 0
+)
+
+
+def _dumps(obj: Any) -> str:
+    """핸들러 응답용 JSON 직렬화 (orjson: C 구현, UTF-8 네이티브)"""
+    return orjson.dumps(obj, option=_DUMPS_OPTS).decode()
+
+
+def _scenario_json(scenario: ScenarioConfig) -> str:
+    """시나리오 직렬화: default 훅으로 to_dict를 직렬화 시점에 호출 (캐시된 dict 재사용)"""
+    return orjson.dumps(scenario, default=_model_default, option=_DUMPS_OPTS).decode()
+
 
+def _model_default(o: Any) -> Any:
+    """orjson이 모르는 객체를 dict로 변환하는 훅"""
+    return o.to_dict() if hasattr(o, "to_dict") else o.__dict__
 
+
+@functools.cache
 def get_templates_directory() -> Path:
     """Get templates directory path (relative to project root)."""
     # 프로젝트 루트 디렉토리 찾기 (src/mock_itr_scenario_mcp/server.py 기준)
@@ -69,157 +77,269 @@ def get_templates_directory() -> Path:
     return templates_dir
 
 
+@functools.lru_cache(maxsize=1)
 def load_templates() -> dict[str, dict[str, Any]]:
-    """Load templates from local templates directory."""
-    global TEMPLATES
-    if TEMPLATES:
-        return TEMPLATES
-    
+    """Load templates from local templates directory (최초 1회만 디스크 접근, 이후 캐시 반환)."""
+    templates: dict[str, dict[str, Any]] = {}
     try:
         templates_dir = get_templates_directory()
-        
+
         if not templates_dir.exists():
-            logger.warning(f"Templates directory not found: {templates_dir}")
-            logger.info("Templates directory will be created if needed. You can add template JSON files (TPL_*.json) to it.")
-            return TEMPLATES
-        
-        for template_file in templates_dir.glob("TPL_*.json"):
-            template_id = template_file.stem
+            logger.warning("Templates directory not found: %s", templates_dir)
+            logger.info("Add template JSON files (TPL_*.json) to it and restart the server; templates are loaded once per process.")
+            return templates
+
+        # glob은 엔트리마다 stat + fnmatch를 수행하므로 scandir로 한 번에 나열
+        with os.scandir(templates_dir) as entries:
+            template_files = [
+                entry for entry in entries
+                if entry.name.startswith("TPL_") and entry.name.endswith(".json")
+            ]
+
+        # 루프 안에서 반복되는 메서드/전역 조회를 지역 변수로 호이스팅
+        _set_template = templates.__setitem__
+        _loads = orjson.loads
+        _log_info = logger.info
+        _log_error = logger.error
+
+        for template_file in template_files:
+            template_id = template_file.name[:-5]  # ".json" 제거
             try:
-                with open(template_file, "r", encoding="utf-8") as f:
-                    TEMPLATES[template_id] = json.load(f)
-                    logger.info(f"Loaded template: {template_id}")
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse template {template_id}: {e}")
+                with open(template_file.path, "rb") as f:
+                    _set_template(template_id, _loads(f.read()))
+                    _log_info("Loaded template: %s", template_id)
+            except orjson.JSONDecodeError as e:
+                _log_error("Failed to parse template %s: %s", template_id, e)
             except Exception as e:
-                logger.error(f"Failed to load template {template_id}: {e}")
-        
-        if not TEMPLATES:
-            logger.info(f"No templates found in {templates_dir}. Add TPL_*.json files to use templates.")
-        
+                _log_error("Failed to load template %s: %s", template_id, e)
+
+        if not templates:
+            logger.info("No templates found in %s. Add TPL_*.json files and restart the server to load them.", templates_dir)
+
     except Exception as e:
-        logger.error(f"Failed to load templates: {e}")
-    
-    return TEMPLATES
+        logger.error("Failed to load templates: %s", e)
+
+    return templates
+
+
+def _invalidate_templates() -> None:
+    """템플릿 캐시 무효화 (테스트용, 파생 캐시 포함)"""
+    load_templates.cache_clear()
+    _templates_by_category.cache_clear()
+    _template_list_json.cache_clear()
+    _dump_template.cache_clear()
+    _templates_resource_json.cache_clear()
+    _template_ddb_item.cache_clear()
 
 
 # ============================================================================
 # Helper Functions for Request/Response Data
 # ============================================================================
 
+# 성공 응답 공통 조각 (호출마다 동일한 리터럴을 새로 만들지 않도록 모듈 레벨에서 공유)
+_OK_ERROR: dict[str, Any] = {"status": False, "type": "", "msg": ""}
+_DEFAULT_HOMETAX_COOKIES: dict[str, Any] = {
+    ".hometax.go.kr": {
+        "NTS_LOGIN_SYSTEM_CODE_P": "TXPP",
+        "TXPPsessionID": "Fe8izH1OP6CLH0x5pRJps7hZm28ySco3x3NPWDxcgYyfmsXGbNyF6NpJZK9r3OQ1.tupiwsp26_servlet_TXPP01"
+    }
+}
+# 응답 플레이스홀더 기본값
+_DEFAULT_REQ_TX_ID = "7cd3..."
+_DEFAULT_TOKEN = "eyJh..."
+_DEFAULT_CX_ID = "10db..."
+_DEFAULT_TIN = "000000000000000000"
+# taxpayer_info가 없을 때 쓰는 기본 TIN 기반 파일 키 (호출마다 f-string 포매팅 생략)
+_DEFAULT_LOAD_TIN = "000000154401000000"
+_DEFAULT_DATA_KEY = f"{_DEFAULT_LOAD_TIN}_data.json"
+_DEFAULT_CALC_DATA_KEY = f"{_DEFAULT_LOAD_TIN}_calc_data.json"
+_DEFAULT_RESULT_DATA_KEY = f"{_DEFAULT_LOAD_TIN}_result_data.json"
+_EMPTY_YEARS: dict[str, Any] = {"2019": {}, "2020": {}, "2021": {}, "2022": {}, "2023": {}}
+_TOUCHCALL_YEARS_TRUE: dict[str, bool] = {
+    "2019": True, "2020": True, "2021": True, "2022": True, "2023": True
+}
+
+# 인자가 전부 기본값인 성공 응답 (목업 호출의 지배적 경로) — 직렬화 직후 버려지므로 공유 반환
+_DEFAULT_SUCCESS_RESPONSES: dict[str, dict[str, Any]] = {
+    "cert_request": {
+        "error": _OK_ERROR,
+        "result": {"reqTxId": _DEFAULT_REQ_TX_ID, "token": _DEFAULT_TOKEN, "cxId": _DEFAULT_CX_ID},
+    },
+    "cert_response": {"error": _OK_ERROR, "result": {"token": _DEFAULT_TOKEN}},
+    "check": {
+        "error": _OK_ERROR,
+        "result": {"tin": _DEFAULT_TIN, "cookies": _DEFAULT_HOMETAX_COOKIES},
+    },
+    "calc": {"error": _OK_ERROR, "result": {}},
+    "corp_check": {
+        "error": _OK_ERROR,
+        "result": {
+            "구분": "법인사업자",
+            "사업체명": "주식회사 테스트사업자",
+            "사업자번호": "1234104321",
+            "대표자명": "테스트대표자",
+            "tin": _DEFAULT_TIN,
+            "cookies": _DEFAULT_HOMETAX_COOKIES,
+        },
+    },
+    "corp_load_calc": {
+        "error": _OK_ERROR,
+        "result": {
+            "계산결과": {
+                "총납부세액": 0.0,
+                "미래절세효과": 0.0,
+            }
+        },
+    },
+}
+
+
+# 클래스별 필드명 튜플 (요청 페이로드에 들어가는 중첩 모델만)
+_USER_INFO_FIELDS = tuple(UserInfo.model_fields)
+_CERT_INFO_FIELDS = tuple(CertInfo.model_fields)
+_COMMON_CERT_FIELDS = tuple(CommonCert.model_fields)
+
+
+def _to_dict(obj: BaseModel, fields: tuple[str, ...]) -> dict[str, Any]:
+    """고정된 필드명 튜플로 __dict__를 훑어 None 필드를 제거한 dict 생성"""
+    d = obj.__dict__
+    return {k: d[k] for k in fields if d[k] is not None}
+
+
+def _err(error_type: str | None, error_msg: str | None) -> dict[str, Any]:
+    """실패 응답용 에러 봉투 생성"""
+    return {"status": True, "type": error_type or "", "msg": error_msg or ""}
+
+
+def _ac(
+    success: bool,
+    request_data: dict[str, Any] | None,
+    response_data: dict[str, Any] | None,
+    error_type: str | None = None,
+    error_msg: str | None = None,
+) -> ActionConfig:
+    """ActionConfig 생성 헬퍼 (내부에서 만든 신뢰 가능한 값이므로 검증 없이 조립)"""
+    return ActionConfig.model_construct(
+        success=success,
+        error_type=error_type,
+        error_msg=error_msg,
+        request_data=request_data,
+        response_data=response_data,
+    )
+
+
+def _pick(arguments: dict[str, Any], defaults: tuple[tuple[str, Any], ...]) -> list[Any]:
+    """핸들러 인자 추출: (키, 기본값) 튜플 순서대로 한 번에 조회"""
+    get = arguments.get
+    return [get(k, v) for k, v in defaults]
+
+
+
+# 공동인증서 스텁 (CommonCert는 불변 샘플 데이터이므로 전 핸들러가 한 인스턴스 공유)
+_STUB_COMMON_CERT = CommonCert(
+    sign_cert="base64_encoded_cert...",
+    sign_pri="base64_encoded_pri...",
+    sign_pw="cert_password",
+)
+
+# cert_type별 고정 CertInfo 스텁과 대응 성공 응답 (값이 전부 플레이스홀더라 호출마다 재생성 불필요)
+_STUB_CERT_INFO: dict[str, CertInfo] = {
+    ct.value: CertInfo(
+        cert_type=ct,
+        req_tx_id=_DEFAULT_REQ_TX_ID,
+        token=_DEFAULT_TOKEN,
+        cx_id=_DEFAULT_CX_ID,
+    )
+    for ct in CertType
+}
+
+@functools.lru_cache(maxsize=512)
+def _user_info_with_default_cert(name: str, phone: str, birthday: str) -> UserInfo:
+    """기본 cert_type(kakao)이 채워진 UserInfo 생성 (동일 입력 반복 시 검증된 인스턴스 재사용)"""
+    return UserInfo(name=name, phone=phone, birthday=birthday, cert_type="kakao")
+
+
 def build_cert_request_data(user_info: UserInfo, user_ern: str = "") -> dict[str, Any]:
     """cert_request 요청 데이터 생성"""
     # cert_type이 없으면 기본값 설정
     if not user_info.cert_type:
-        user_info_with_cert = UserInfo(
-            name=user_info.name,
-            phone=user_info.phone,
-            birthday=user_info.birthday,
-            cert_type="kakao",  # 기본값
+        user_info_with_cert = _user_info_with_default_cert(
+            user_info.name, user_info.phone, user_info.birthday
         )
     else:
         user_info_with_cert = user_info
     
-    request = CertRequestRequest(
-        action="cert_request",
-        user_info=user_info_with_cert,
-        user_ern=user_ern,
-    )
-    return request.model_dump(exclude_none=True)
+    return {
+        "action": "cert_request",
+        "user_info": _to_dict(user_info_with_cert, _USER_INFO_FIELDS),
+        "user_ern": user_ern,
+    }
 
 
 def build_cert_request_response(success: bool, cert_info: CertInfo | None = None, error_type: str | None = None, error_msg: str | None = None) -> dict[str, Any]:
     """cert_request 응답 데이터 생성"""
     if success and cert_info:
-        response = CertRequestResponse(
-            error={"status": False, "type": "", "msg": ""},
-            result={
-                "reqTxId": cert_info.req_tx_id or "7cd3...",
-                "token": cert_info.token or "eyJh...",
-                "cxId": cert_info.cx_id or "10db...",
-            }
-        )
-    else:
-        response = CertRequestResponse(
-            error={
-                "status": True,
-                "type": error_type or "",
-                "msg": error_msg or "",
+        if not (cert_info.req_tx_id or cert_info.token or cert_info.cx_id):
+            return _DEFAULT_SUCCESS_RESPONSES["cert_request"]
+        return {
+            "error": _OK_ERROR,
+            "result": {
+                "reqTxId": cert_info.req_tx_id or _DEFAULT_REQ_TX_ID,
+                "token": cert_info.token or _DEFAULT_TOKEN,
+                "cxId": cert_info.cx_id or _DEFAULT_CX_ID,
             },
-            result={}
-        )
-    return response.model_dump(exclude_none=True)
+        }
+    return {"error": _err(error_type, error_msg), "result": {}}
 
 
 def build_cert_response_data(user_info: UserInfo, cert_info: CertInfo, user_ern: str = "") -> dict[str, Any]:
     """cert_response 요청 데이터 생성"""
-    request = CertResponseRequest(
-        action="cert_response",
-        user_info=user_info,
-        cert_info=cert_info,
-        user_ern=user_ern,
-    )
-    return request.model_dump(exclude_none=True)
+    return {
+        "action": "cert_response",
+        "user_info": _to_dict(user_info, _USER_INFO_FIELDS),
+        "cert_info": _to_dict(cert_info, _CERT_INFO_FIELDS),
+        "user_ern": user_ern,
+    }
 
 
 def build_cert_response_response(success: bool, token: str = "", error_type: str | None = None, error_msg: str | None = None) -> dict[str, Any]:
     """cert_response 응답 데이터 생성"""
     if success:
-        response = CertResponseResponse(
-            error={"status": False, "type": "", "msg": ""},
-            result={"token": token or "eyJh..."}
-        )
-    else:
-        response = CertResponseResponse(
-            error={
-                "status": True,
-                "type": error_type or "",
-                "msg": error_msg or "",
-            },
-            result={}
-        )
-    return response.model_dump(exclude_none=True)
+        if not token:
+            return _DEFAULT_SUCCESS_RESPONSES["cert_response"]
+        return {"error": _OK_ERROR, "result": {"token": token}}
+    return {"error": _err(error_type, error_msg), "result": {}}
 
 
 def build_check_request_data(id: str = "", pw: str = "", token: str = "", common_cert: CommonCert | None = None, cookies: dict[str, Any] | None = None, user_ern: str = "") -> dict[str, Any]:
     """check 요청 데이터 생성"""
-    request = CheckRequest(
-        action="check",
-        id=id,
-        pw=pw,
-        token=token,  # cert_response에서 받은 token (간편인증 flow)
-        common_cert=common_cert,  # 공동인증서 정보 (공동인증서 flow)
-        cookies=cookies,
-        user_ern=user_ern,
-    )
-    return request.model_dump(exclude_none=True)
+    out: dict[str, Any] = {
+        "action": "check",
+        "id": id,
+        "pw": pw,
+        "token": token,  # cert_response에서 받은 token (간편인증 flow)
+    }
+    if common_cert is not None:  # 공동인증서 정보 (공동인증서 flow)
+        out["common_cert"] = _to_dict(common_cert, _COMMON_CERT_FIELDS)
+    if cookies is not None:
+        out["cookies"] = cookies
+    out["user_ern"] = user_ern
+    return out
 
 
 def build_check_response(success: bool, tin: str = "", cookies: dict[str, Any] | None = None, error_type: str | None = None, error_msg: str | None = None) -> dict[str, Any]:
     """check 응답 데이터 생성"""
     if success:
-        response = CheckResponse(
-            error={"status": False, "type": "", "msg": ""},
-            result={
-                "tin": tin or "000000000000000000",
-                "cookies": cookies or {
-                    ".hometax.go.kr": {
-                        "NTS_LOGIN_SYSTEM_CODE_P": "TXPP",
-                        "TXPPsessionID": "Fe8izH1OP6CLH0x5pRJps7hZm28ySco3x3NPWDxcgYyfmsXGbNyF6NpJZK9r3OQ1.tupiwsp26_servlet_TXPP01"
-                    }
-                }
-            }
-        )
-    else:
-        response = CheckResponse(
-            error={
-                "status": True,
-                "type": error_type or "",
-                "msg": error_msg or "",
+        if not tin and not cookies:
+            return _DEFAULT_SUCCESS_RESPONSES["check"]
+        return {
+            "error": _OK_ERROR,
+            "result": {
+                "tin": tin or _DEFAULT_TIN,
+                "cookies": cookies or _DEFAULT_HOMETAX_COOKIES,
             },
-            result={}
-        )
-    return response.model_dump(exclude_none=True)
+        }
+    return {"error": _err(error_type, error_msg), "result": {}}
 
 
 def build_load_request_data(
@@ -236,21 +356,22 @@ def build_load_request_data(
     send_next_step: bool = True,
 ) -> dict[str, Any]:
     """load 요청 데이터 생성"""
-    request = LoadRequest(
-        action="load",
-        id=id,
-        pw=pw,
-        token=token,
-        cookies=cookies,
-        reg_no=reg_no,
-        export_file_prefix=export_file_prefix,
-        user_ern=user_ern,
-        use_sqs=use_sqs,
-        corp_type=corp_type,
-        tin=tin,
-        send_next_step=send_next_step,
-    )
-    return request.model_dump(exclude_none=True)
+    out: dict[str, Any] = {
+        "action": "load",
+        "id": id,
+        "pw": pw,
+        "token": token,
+    }
+    if cookies is not None:
+        out["cookies"] = cookies
+    out["reg_no"] = reg_no
+    out["export_file_prefix"] = export_file_prefix
+    out["user_ern"] = user_ern
+    out["use_sqs"] = use_sqs
+    out["corp_type"] = corp_type
+    out["tin"] = tin
+    out["send_next_step"] = send_next_step
+    return out
 
 
 def build_load_response(
@@ -263,21 +384,34 @@ def build_load_response(
 ) -> dict[str, Any]:
     """load 응답 데이터 생성"""
     if success and refund_result:
-        tin = taxpayer_info.tin if taxpayer_info else "000000154401000000"
+        if taxpayer_info:
+            tin = taxpayer_info.tin
+            data_key = f"{tin}_data.json"
+            calc_data_key = f"{tin}_calc_data.json"
+            result_data_key = f"{tin}_result_data.json"
+            payer_name = taxpayer_info.tax_office_name
+            tax_office = taxpayer_info.tax_office_name
+        else:
+            data_key = _DEFAULT_DATA_KEY
+            calc_data_key = _DEFAULT_CALC_DATA_KEY
+            result_data_key = _DEFAULT_RESULT_DATA_KEY
+            payer_name = "테스트납세자"
+            tax_office = "강남세무서"
+        refund_amt = float(refund_result.total_refund)
         # 환경변수에서 귀속연도 가져오기
         model_year = os.environ.get("MOCK_ITR_MODEL_YEAR", "2024")
-        response = LoadResponse(
-            error={"status": False, "type": "", "msg": ""},
-            result={
-                "수집데이터_key": f"{tin}_data.json",
-                "계산데이터_key": f"{tin}_calc_data.json",
-                "결과데이터_key": f"{tin}_result_data.json",
-                "납세자명": taxpayer_info.tax_office_name if taxpayer_info else "테스트납세자",
-                "총환급세액": float(refund_result.total_refund),
+        return {
+            "error": _OK_ERROR,
+            "result": {
+                "수집데이터_key": data_key,
+                "계산데이터_key": calc_data_key,
+                "결과데이터_key": result_data_key,
+                "납세자명": payer_name,
+                "총환급세액": refund_amt,
                 "버전정보": version_info or {"연도": model_year, "버전": "1.0"},
-                "신고자": taxpayer_info.tax_office_name if taxpayer_info else "테스트납세자",
+                "신고자": payer_name,
                 "주민등록번호": "",
-                "관할세무서": taxpayer_info.tax_office_name if taxpayer_info else "강남세무서",
+                "관할세무서": tax_office,
                 "담당조사관": "",
                 "담당조사관전화번호": "",
                 "감면Only추가구제": False,
@@ -285,34 +419,13 @@ def build_load_response(
                 "고용보험조회필요": False,
                 "전자신고": True,
                 "최근계산연도": int(model_year),
-                "사업장": {
-                    "2019": {},
-                    "2020": {},
-                    "2021": {},
-                    "2022": {},
-                    "2023": {},
-                },
+                "사업장": _EMPTY_YEARS,
                 "터칭콜반영": False,
-                "터칭콜검토필요": {
-                    "2019": True,
-                    "2020": True,
-                    "2021": True,
-                    "2022": True,
-                    "2023": True,
-                },
-                "refundAmt_SVI": float(refund_result.total_refund),
-            }
-        )
-    else:
-        response = LoadResponse(
-            error={
-                "status": True,
-                "type": error_type or "",
-                "msg": error_msg or "",
+                "터칭콜검토필요": _TOUCHCALL_YEARS_TRUE,
+                "refundAmt_SVI": refund_amt,
             },
-            result={}
-        )
-    return response.model_dump(exclude_none=True)
+        }
+    return {"error": _err(error_type, error_msg), "result": {}}
 
 
 def build_calc_request_data(
@@ -323,34 +436,25 @@ def build_calc_request_data(
     calc_version: str = "latest",
 ) -> dict[str, Any]:
     """calc 요청 데이터 생성"""
-    request = CalcRequest(
-        action="calc",
-        export_file_prefix=export_file_prefix,
-        model_year=model_year,
-        survey_contents=survey_contents,
-        user_ern=user_ern,
-        calc_version=calc_version,
-    )
-    return request.model_dump(exclude_none=True)
+    out: dict[str, Any] = {
+        "action": "calc",
+        "export_file_prefix": export_file_prefix,
+        "model_year": model_year,
+    }
+    if survey_contents is not None:
+        out["survey_contents"] = survey_contents
+    out["user_ern"] = user_ern
+    out["calc_version"] = calc_version
+    return out
 
 
 def build_calc_response(success: bool, result_data: dict[str, Any] | None = None, error_type: str | None = None, error_msg: str | None = None) -> dict[str, Any]:
     """calc 응답 데이터 생성"""
     if success:
-        response = CalcResponse(
-            error={"status": False, "type": "", "msg": ""},
-            result=result_data or {}
-        )
-    else:
-        response = CalcResponse(
-            error={
-                "status": True,
-                "type": error_type or "",
-                "msg": error_msg or "",
-            },
-            result={}
-        )
-    return response.model_dump(exclude_none=True)
+        if not result_data:
+            return _DEFAULT_SUCCESS_RESPONSES["calc"]
+        return {"error": _OK_ERROR, "result": result_data}
+    return {"error": _err(error_type, error_msg), "result": {}}
 
 
 def build_corp_check_request_data(
@@ -362,16 +466,18 @@ def build_corp_check_request_data(
     user_ern: str = "",
 ) -> dict[str, Any]:
     """corp_check 요청 데이터 생성"""
-    request = CorpCheckRequest(
-        action="corp_check",
-        id=id,
-        pw=pw,
-        resno=resno,
-        common_cert=common_cert,
-        cookies=cookies,
-        user_ern=user_ern,
-    )
-    return request.model_dump(exclude_none=True)
+    out: dict[str, Any] = {
+        "action": "corp_check",
+        "id": id,
+        "pw": pw,
+        "resno": resno,
+    }
+    if common_cert is not None:
+        out["common_cert"] = _to_dict(common_cert, _COMMON_CERT_FIELDS)
+    if cookies is not None:
+        out["cookies"] = cookies
+    out["user_ern"] = user_ern
+    return out
 
 
 def build_corp_check_response(
@@ -386,32 +492,20 @@ def build_corp_check_response(
 ) -> dict[str, Any]:
     """corp_check 응답 데이터 생성"""
     if success:
-        response = CorpCheckResponse(
-            error={"status": False, "type": "", "msg": ""},
-            result={
+        if not (biz_name or biz_no or ceo_name or tin or cookies):
+            return _DEFAULT_SUCCESS_RESPONSES["corp_check"]
+        return {
+            "error": _OK_ERROR,
+            "result": {
                 "구분": "법인사업자",
                 "사업체명": biz_name or "주식회사 테스트사업자",
                 "사업자번호": biz_no or "1234104321",
                 "대표자명": ceo_name or "테스트대표자",
-                "tin": tin or "000000000000000000",
-                "cookies": cookies or {
-                    ".hometax.go.kr": {
-                        "NTS_LOGIN_SYSTEM_CODE_P": "TXPP",
-                        "TXPPsessionID": "Fe8izH1OP6CLH0x5pRJps7hZm28ySco3x3NPWDxcgYyfmsXGbNyF6NpJZK9r3OQ1.tupiwsp26_servlet_TXPP01"
-                    }
-                }
-            }
-        )
-    else:
-        response = CorpCheckResponse(
-            error={
-                "status": True,
-                "type": error_type or "",
-                "msg": error_msg or "",
+                "tin": tin or _DEFAULT_TIN,
+                "cookies": cookies or _DEFAULT_HOMETAX_COOKIES,
             },
-            result={}
-        )
-    return response.model_dump(exclude_none=True)
+        }
+    return {"error": _err(error_type, error_msg), "result": {}}
 
 
 def build_corp_load_calc_request_data(
@@ -422,15 +516,14 @@ def build_corp_load_calc_request_data(
     tin: str = "",
 ) -> dict[str, Any]:
     """corp_load_calc 요청 데이터 생성"""
-    request = CorpLoadCalcRequest(
-        action="corp_load_calc",
-        cookies=cookies,  # check에서 받은 cookies
-        export_file_prefix=export_file_prefix,
-        user_ern=user_ern,
-        use_sqs=use_sqs,
-        tin=tin,
-    )
-    return request.model_dump(exclude_none=True)
+    out: dict[str, Any] = {"action": "corp_load_calc"}
+    if cookies is not None:  # check에서 받은 cookies
+        out["cookies"] = cookies
+    out["export_file_prefix"] = export_file_prefix
+    out["user_ern"] = user_ern
+    out["use_sqs"] = use_sqs
+    out["tin"] = tin
+    return out
 
 
 def build_corp_load_calc_response(
@@ -441,493 +534,578 @@ def build_corp_load_calc_response(
 ) -> dict[str, Any]:
     """corp_load_calc 응답 데이터 생성"""
     if success:
-        response = CorpLoadCalcResponse(
-            error={"status": False, "type": "", "msg": ""},
-            result=result_data or {
-                "계산결과": {
-                    "총납부세액": 0.0,
-                    "미래절세효과": 0.0,
-                }
+        if not result_data:
+            return _DEFAULT_SUCCESS_RESPONSES["corp_load_calc"]
+        return {"error": _OK_ERROR, "result": result_data}
+    return {"error": _err(error_type, error_msg), "result": {}}
+
+
+# 에러 시나리오 액션 디스패치 테이블: 액션별 (설정 필드명, 요청 데이터 빌더, 응답 빌더)
+# if/elif 사다리 대신 단일 해시 조회로 분기
+_ERROR_ACTION_BUILDERS: dict[str, tuple[str, Callable[[UserInfo], dict[str, Any]], Callable[..., dict[str, Any]]]] = {
+    "cert_request": (
+        "cert_request_config",
+        lambda user_info: build_cert_request_data(user_info=user_info),
+        build_cert_request_response,
+    ),
+    "cert_response": (
+        "cert_response_config",
+        lambda user_info: build_cert_response_data(user_info=user_info, cert_info=CertInfo()),
+        build_cert_response_response,
+    ),
+    "check": (
+        "check_config",
+        lambda user_info: build_check_request_data(),
+        build_check_response,
+    ),
+    "load": (
+        "load_config",
+        lambda user_info: build_load_request_data(export_file_prefix=TaxpayerInfo().tin),
+        build_load_response,
+    ),
+}
+
+
+def _check_load_success_configs(
+    check_request: dict[str, Any],
+    taxpayer_info: TaxpayerInfo,
+    refund_result: RefundResult,
+    use_sqs: bool = False,
+) -> dict[str, ActionConfig]:
+    """check -> load 성공 flow 설정 묶음 (check 요청은 로그인 방식에 따라 다르므로 인자로 받음)"""
+    check_response = build_check_response(success=True, tin=taxpayer_info.tin)
+    load_request = build_load_request_data(
+        cookies=check_response["result"]["cookies"],
+        export_file_prefix=taxpayer_info.tin,
+        use_sqs=use_sqs,
+    )
+    load_response = build_load_response(
+        success=True,
+        refund_result=refund_result,
+        taxpayer_info=taxpayer_info,
+    )
+    return {
+        "check_config": _ac(True, check_request, check_response),
+        "load_config": _ac(True, load_request, load_response),
+    }
+
+
+def _simple_auth_success_configs(
+    user_info: UserInfo,
+    cert_info: CertInfo,
+    taxpayer_info: TaxpayerInfo,
+    refund_result: RefundResult,
+) -> dict[str, ActionConfig]:
+    """간편인증 성공 flow(cert_request -> cert_response -> check -> load) 설정 묶음"""
+    configs = _check_load_success_configs(
+        build_check_request_data(token=_DEFAULT_TOKEN), taxpayer_info, refund_result
+    )
+    configs["cert_request_config"] = _ac(
+        True, build_cert_request_data(user_info=user_info), _DEFAULT_SUCCESS_RESPONSES["cert_request"]
+    )
+    configs["cert_response_config"] = _ac(
+        True,
+        build_cert_response_data(user_info=user_info, cert_info=cert_info),
+        _DEFAULT_SUCCESS_RESPONSES["cert_response"],
+    )
+    return configs
+
+
+def _corp_success_configs(
+    corp_check_request: dict[str, Any],
+    biz_name: str,
+    biz_no: str,
+    ceo_name: str,
+    taxpayer_info: TaxpayerInfo,
+) -> dict[str, ActionConfig]:
+    """corp_check -> corp_load_calc 성공 flow 설정 묶음"""
+    corp_check_response = build_corp_check_response(
+        success=True,
+        biz_name=biz_name,
+        biz_no=biz_no,
+        ceo_name=ceo_name,
+        tin=taxpayer_info.tin,
+    )
+    corp_load_calc_request = build_corp_load_calc_request_data(
+        cookies=corp_check_response["result"]["cookies"],
+        export_file_prefix=taxpayer_info.tin,
+        tin=taxpayer_info.tin,
+    )
+    corp_load_calc_response = build_corp_load_calc_response(
+        success=True,
+        result_data={
+            "계산결과": {
+                "총납부세액": 0.0,
+                "미래절세효과": 0.0,
             }
-        )
-    else:
-        response = CorpLoadCalcResponse(
-            error={
-                "status": True,
-                "type": error_type or "",
-                "msg": error_msg or "",
-            },
-            result={}
-        )
-    return response.model_dump(exclude_none=True)
+        }
+    )
+    return {
+        "corp_check_config": _ac(True, corp_check_request, corp_check_response),
+        "corp_load_calc_config": _ac(True, corp_load_calc_request, corp_load_calc_response),
+    }
 
 
 # ============================================================================
 # MCP Tools
 # ============================================================================
 
-@server.list_tools()
-async def list_tools() -> list[Tool]:
-    """List available tools."""
-    return [
-        Tool(
-            name="template_list",
-            description="사용 가능한 시나리오 템플릿 목록을 조회합니다.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "category": {
-                        "type": "string",
-                        "description": "템플릿 카테고리 (normal, error, corp, all)",
-                        "enum": ["normal", "error", "corp", "all"],
-                        "default": "all"
-                    }
+# 정적 Tool 스키마 목록: 매 핸드셰이크마다 재구성하지 않도록 임포트 시 한 번만 생성
+# (값 문자열 -> ErrorType 매핑은 Enum.__call__ 대신 단일 dict 조회용)
+_ERROR_TYPE_BY_VALUE = {e.value: e for e in ErrorType}
+_ERROR_TYPE_VALUES = tuple(_ERROR_TYPE_BY_VALUE)
+_TOOLS_CACHE: list[Tool] = [
+    Tool(
+        name="template_list",
+        description="사용 가능한 시나리오 템플릿 목록을 조회합니다.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "category": {
+                    "type": "string",
+                    "description": "템플릿 카테고리 (normal, error, corp, all)",
+                    "enum": ["normal", "error", "corp", "all"],
+                    "default": "all"
                 }
             }
-        ),
-        Tool(
-            name="template_load",
-            description="특정 템플릿을 로드하여 상세 내용을 확인합니다.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "template_id": {
-                        "type": "string",
-                        "description": "템플릿 ID (예: TPL_NORMAL_BIZ_HIGH)"
-                    }
+        }
+    ),
+    Tool(
+        name="template_load",
+        description="특정 템플릿을 로드하여 상세 내용을 확인합니다.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "template_id": {
+                    "type": "string",
+                    "description": "템플릿 ID (예: TPL_NORMAL_BIZ_HIGH)"
+                }
+            },
+            "required": ["template_id"]
+        }
+    ),
+    Tool(
+        name="scenario_build_normal",
+        description="정상 환급 시나리오를 생성합니다.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "user_name": {
+                    "type": "string",
+                    "description": "사용자 이름",
+                    "default": "테스트사용자"
                 },
-                "required": ["template_id"]
-            }
-        ),
-        Tool(
-            name="scenario_build_normal",
-            description="정상 환급 시나리오를 생성합니다.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "user_name": {
-                        "type": "string",
-                        "description": "사용자 이름",
-                        "default": "테스트사용자"
-                    },
-                    "total_refund": {
-                        "type": "integer",
-                        "description": "총 환급액 (원)"
-                    },
-                    "biz_type": {
-                        "type": "string",
-                        "description": "사업자 유형",
-                        "enum": ["individual_biz", "non_biz", "corp"],
-                        "default": "individual_biz"
-                    },
-                    "login_method": {
-                        "type": "string",
-                        "description": "로그인 방식 (개인: simple_auth, common_cert / 법인: corp_common_cert, corp_id_pw)",
-                        "enum": ["simple_auth", "common_cert", "corp_common_cert", "corp_id_pw"],
-                        "default": "simple_auth"
-                    },
-                    "cert_type": {
-                        "type": "string",
-                        "description": "간편인증 유형 (login_method가 simple_auth일 때만 사용)",
-                        "enum": ["kakao", "naver"],
-                        "default": "kakao"
-                    },
-                    "창중감_환급액": {
-                        "type": "integer",
-                        "description": "창업중소기업감면 환급액",
-                        "default": 0
-                    },
-                    "고용증대_환급액": {
-                        "type": "integer",
-                        "description": "고용증대 환급액",
-                        "default": 0
-                    },
-                    "사회보험료_환급액": {
-                        "type": "integer",
-                        "description": "사회보험료 환급액",
-                        "default": 0
-                    },
-                    "양도세_환급액": {
-                        "type": "integer",
-                        "description": "양도세 환급액",
-                        "default": 0
-                    }
+                "total_refund": {
+                    "type": "integer",
+                    "description": "총 환급액 (원)"
                 },
-                "required": ["total_refund"]
-            }
-        ),
-        Tool(
-            name="scenario_build_error",
-            description="에러 시나리오를 생성합니다.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "user_name": {
-                        "type": "string",
-                        "description": "사용자 이름",
-                        "default": "테스트사용자"
-                    },
-                    "error_type": {
-                        "type": "string",
-                        "description": "에러 타입",
-                        "enum": [e.value for e in ErrorType]
-                    },
-                    "error_msg": {
-                        "type": "string",
-                        "description": "에러 메시지 (미입력시 기본 메시지 사용)"
-                    },
-                    "action": {
-                        "type": "string",
-                        "description": "에러 발생 액션",
-                        "enum": ["cert_request", "cert_response", "check", "load"],
-                        "default": "load"
-                    }
+                "biz_type": {
+                    "type": "string",
+                    "description": "사업자 유형",
+                    "enum": ["individual_biz", "non_biz", "corp"],
+                    "default": "individual_biz"
                 },
-                "required": ["error_type"]
-            }
-        ),
-        Tool(
-            name="scenario_build_progress",
-            description="진행률 전송을 포함한 시나리오를 생성합니다.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "user_name": {
-                        "type": "string",
-                        "description": "사용자 이름",
-                        "default": "테스트사용자"
-                    },
-                    "total_refund": {
-                        "type": "integer",
-                        "description": "총 환급액 (원)"
-                    },
-                    "queue_name": {
-                        "type": "string",
-                        "description": "SQS 큐 이름",
-                        "default": "refund-search.fifo"
-                    },
-                    "steps": {
-                        "type": "array",
-                        "description": "진행률 단계 목록",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "step_name": {"type": "string"},
-                                "progress": {"type": "string"},
-                                "delay_seconds": {"type": "number", "default": 0.5}
-                            },
-                            "required": ["step_name", "progress"]
-                        }
-                    }
+                "login_method": {
+                    "type": "string",
+                    "description": "로그인 방식 (개인: simple_auth, common_cert / 법인: corp_common_cert, corp_id_pw)",
+                    "enum": ["simple_auth", "common_cert", "corp_common_cert", "corp_id_pw"],
+                    "default": "simple_auth"
                 },
-                "required": ["total_refund"]
-            }
-        ),
-        Tool(
-            name="scenario_validate",
-            description="시나리오 유효성을 검사합니다.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "scenario": {
-                        "type": "object",
-                        "description": "검사할 시나리오 객체"
-                    }
+                "cert_type": {
+                    "type": "string",
+                    "description": "간편인증 유형 (login_method가 simple_auth일 때만 사용)",
+                    "enum": ["kakao", "naver"],
+                    "default": "kakao"
                 },
-                "required": ["scenario"]
-            }
-        ),
-        Tool(
-            name="scenario_assign",
-            description="시나리오를 특정 user_ern에 할당합니다 (DynamoDB에 저장).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "user_ern": {
-                        "type": "string",
-                        "description": "사용자 ERN"
-                    },
-                    "scenario": {
+                "창중감_환급액": {
+                    "type": "integer",
+                    "description": "창업중소기업감면 환급액",
+                    "default": 0
+                },
+                "고용증대_환급액": {
+                    "type": "integer",
+                    "description": "고용증대 환급액",
+                    "default": 0
+                },
+                "사회보험료_환급액": {
+                    "type": "integer",
+                    "description": "사회보험료 환급액",
+                    "default": 0
+                },
+                "양도세_환급액": {
+                    "type": "integer",
+                    "description": "양도세 환급액",
+                    "default": 0
+                }
+            },
+            "required": ["total_refund"]
+        }
+    ),
+    Tool(
+        name="scenario_build_error",
+        description="에러 시나리오를 생성합니다.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "user_name": {
+                    "type": "string",
+                    "description": "사용자 이름",
+                    "default": "테스트사용자"
+                },
+                "error_type": {
+                    "type": "string",
+                    "description": "에러 타입",
+                    "enum": list(_ERROR_TYPE_VALUES)
+                },
+                "error_msg": {
+                    "type": "string",
+                    "description": "에러 메시지 (미입력시 기본 메시지 사용)"
+                },
+                "action": {
+                    "type": "string",
+                    "description": "에러 발생 액션",
+                    "enum": ["cert_request", "cert_response", "check", "load"],
+                    "default": "load"
+                }
+            },
+            "required": ["error_type"]
+        }
+    ),
+    Tool(
+        name="scenario_build_progress",
+        description="진행률 전송을 포함한 시나리오를 생성합니다.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "user_name": {
+                    "type": "string",
+                    "description": "사용자 이름",
+                    "default": "테스트사용자"
+                },
+                "total_refund": {
+                    "type": "integer",
+                    "description": "총 환급액 (원)"
+                },
+                "queue_name": {
+                    "type": "string",
+                    "description": "SQS 큐 이름",
+                    "default": "refund-search.fifo"
+                },
+                "steps": {
+                    "type": "array",
+                    "description": "진행률 단계 목록",
+                    "items": {
                         "type": "object",
-                        "description": "할당할 시나리오 객체"
-                    },
-                    "template_id": {
-                        "type": "string",
-                        "description": "사용할 템플릿 ID (scenario 미입력시)"
+                        "properties": {
+                            "step_name": {"type": "string"},
+                            "progress": {"type": "string"},
+                            "delay_seconds": {"type": "number", "default": 0.5}
+                        },
+                        "required": ["step_name", "progress"]
                     }
+                }
+            },
+            "required": ["total_refund"]
+        }
+    ),
+    Tool(
+        name="scenario_validate",
+        description="시나리오 유효성을 검사합니다.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "scenario": {
+                    "type": "object",
+                    "description": "검사할 시나리오 객체"
+                }
+            },
+            "required": ["scenario"]
+        }
+    ),
+    Tool(
+        name="scenario_assign",
+        description="시나리오를 특정 user_ern에 할당합니다 (DynamoDB에 저장).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "user_ern": {
+                    "type": "string",
+                    "description": "사용자 ERN"
                 },
-                "required": ["user_ern"]
-            }
-        ),
-        Tool(
-            name="scenario_unassign",
-            description="user_ern에서 시나리오 할당을 해제합니다.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "user_ern": {
-                        "type": "string",
-                        "description": "사용자 ERN"
-                    }
+                "scenario": {
+                    "type": "object",
+                    "description": "할당할 시나리오 객체"
                 },
-                "required": ["user_ern"]
-            }
-        ),
-        Tool(
-            name="error_types_list",
-            description="지원하는 에러 타입 목록을 조회합니다.",
-            inputSchema={
-                "type": "object",
-                "properties": {}
-            }
-        ),
-        Tool(
-            name="scenario_build_simple_auth",
-            description="[개인] 간편인증 flow 시나리오를 생성합니다. (cert_request -> cert_response -> check -> load)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "user_name": {
-                        "type": "string",
-                        "description": "사용자 이름",
-                        "default": "테스트사용자"
-                    },
-                    "phone": {
-                        "type": "string",
-                        "description": "전화번호",
-                        "default": "01012345678"
-                    },
-                    "birthday": {
-                        "type": "string",
-                        "description": "생년월일 (YYYYMMDD)",
-                        "default": "19900101"
-                    },
-                    "cert_type": {
-                        "type": "string",
-                        "description": "간편인증 유형",
-                        "enum": ["kakao", "naver"],
-                        "default": "kakao"
-                    },
-                    "total_refund": {
-                        "type": "integer",
-                        "description": "총 환급액 (원)"
-                    }
+                "template_id": {
+                    "type": "string",
+                    "description": "사용할 템플릿 ID (scenario 미입력시)"
+                }
+            },
+            "required": ["user_ern"]
+        }
+    ),
+    Tool(
+        name="scenario_unassign",
+        description="user_ern에서 시나리오 할당을 해제합니다.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "user_ern": {
+                    "type": "string",
+                    "description": "사용자 ERN"
+                }
+            },
+            "required": ["user_ern"]
+        }
+    ),
+    Tool(
+        name="error_types_list",
+        description="지원하는 에러 타입 목록을 조회합니다.",
+        inputSchema={
+            "type": "object",
+            "properties": {}
+        }
+    ),
+    Tool(
+        name="scenario_build_simple_auth",
+        description="[개인] 간편인증 flow 시나리오를 생성합니다. (cert_request -> cert_response -> check -> load)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "user_name": {
+                    "type": "string",
+                    "description": "사용자 이름",
+                    "default": "테스트사용자"
                 },
-                "required": ["total_refund"]
-            }
-        ),
-        Tool(
-            name="scenario_build_common_cert",
-            description="[개인] 공동인증서 flow 시나리오를 생성합니다. (check -> load)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "user_name": {
-                        "type": "string",
-                        "description": "사용자 이름",
-                        "default": "테스트사용자"
-                    },
-                    "total_refund": {
-                        "type": "integer",
-                        "description": "총 환급액 (원)"
-                    }
+                "phone": {
+                    "type": "string",
+                    "description": "전화번호",
+                    "default": "01012345678"
                 },
-                "required": ["total_refund"]
-            }
-        ),
-        Tool(
-            name="scenario_build_corp_common_cert",
-            description="[법인] 공동인증서 또는 ID/PW flow 시나리오를 생성합니다. (corp_check -> corp_load_calc)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "biz_name": {
-                        "type": "string",
-                        "description": "사업체명",
-                        "default": "주식회사 테스트사업자"
-                    },
-                    "biz_no": {
-                        "type": "string",
-                        "description": "사업자번호",
-                        "default": "1234104321"
-                    },
-                    "ceo_name": {
-                        "type": "string",
-                        "description": "대표자명",
-                        "default": "테스트대표자"
-                    },
-                    "login_method": {
-                        "type": "string",
-                        "description": "로그인 방식",
-                        "enum": ["corp_common_cert", "corp_id_pw"],
-                        "default": "corp_common_cert"
-                    },
-                    "id": {
-                        "type": "string",
-                        "description": "홈택스 아이디 (login_method가 corp_id_pw일 때만 사용)",
-                        "default": ""
-                    },
-                    "pw": {
-                        "type": "string",
-                        "description": "홈택스 비밀번호 (login_method가 corp_id_pw일 때만 사용)",
-                        "default": ""
-                    },
-                    "resno": {
-                        "type": "string",
-                        "description": "주민번호 앞7자리 (login_method가 corp_id_pw일 때만 사용)",
-                        "default": ""
-                    }
+                "birthday": {
+                    "type": "string",
+                    "description": "생년월일 (YYYYMMDD)",
+                    "default": "19900101"
+                },
+                "cert_type": {
+                    "type": "string",
+                    "description": "간편인증 유형",
+                    "enum": ["kakao", "naver"],
+                    "default": "kakao"
+                },
+                "total_refund": {
+                    "type": "integer",
+                    "description": "총 환급액 (원)"
+                }
+            },
+            "required": ["total_refund"]
+        }
+    ),
+    Tool(
+        name="scenario_build_common_cert",
+        description="[개인] 공동인증서 flow 시나리오를 생성합니다. (check -> load)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "user_name": {
+                    "type": "string",
+                    "description": "사용자 이름",
+                    "default": "테스트사용자"
+                },
+                "total_refund": {
+                    "type": "integer",
+                    "description": "총 환급액 (원)"
+                }
+            },
+            "required": ["total_refund"]
+        }
+    ),
+    Tool(
+        name="scenario_build_corp_common_cert",
+        description="[법인] 공동인증서 또는 ID/PW flow 시나리오를 생성합니다. (corp_check -> corp_load_calc)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "biz_name": {
+                    "type": "string",
+                    "description": "사업체명",
+                    "default": "주식회사 테스트사업자"
+                },
+                "biz_no": {
+                    "type": "string",
+                    "description": "사업자번호",
+                    "default": "1234104321"
+                },
+                "ceo_name": {
+                    "type": "string",
+                    "description": "대표자명",
+                    "default": "테스트대표자"
+                },
+                "login_method": {
+                    "type": "string",
+                    "description": "로그인 방식",
+                    "enum": ["corp_common_cert", "corp_id_pw"],
+                    "default": "corp_common_cert"
+                },
+                "id": {
+                    "type": "string",
+                    "description": "홈택스 아이디 (login_method가 corp_id_pw일 때만 사용)",
+                    "default": ""
+                },
+                "pw": {
+                    "type": "string",
+                    "description": "홈택스 비밀번호 (login_method가 corp_id_pw일 때만 사용)",
+                    "default": ""
+                },
+                "resno": {
+                    "type": "string",
+                    "description": "주민번호 앞7자리 (login_method가 corp_id_pw일 때만 사용)",
+                    "default": ""
                 }
             }
-        ),
-        Tool(
-            name="scenario_build_simple_auth_fail",
-            description="카카오톡 간편인증 요청 실패 시나리오를 생성합니다.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "user_name": {
-                        "type": "string",
-                        "description": "사용자 이름",
-                        "default": "테스트사용자"
-                    },
-                    "phone": {
-                        "type": "string",
-                        "description": "전화번호",
-                        "default": "01012345678"
-                    },
-                    "birthday": {
-                        "type": "string",
-                        "description": "생년월일 (YYYYMMDD)",
-                        "default": "19900101"
-                    },
-                    "cert_type": {
-                        "type": "string",
-                        "description": "간편인증 유형",
-                        "enum": ["kakao", "naver"],
-                        "default": "kakao"
-                    },
-                    "error_msg": {
-                        "type": "string",
-                        "description": "에러 메시지 (미입력시 기본 메시지 사용)",
-                        "default": ""
-                    }
+        }
+    ),
+    Tool(
+        name="scenario_build_simple_auth_fail",
+        description="카카오톡 간편인증 요청 실패 시나리오를 생성합니다.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "user_name": {
+                    "type": "string",
+                    "description": "사용자 이름",
+                    "default": "테스트사용자"
+                },
+                "phone": {
+                    "type": "string",
+                    "description": "전화번호",
+                    "default": "01012345678"
+                },
+                "birthday": {
+                    "type": "string",
+                    "description": "생년월일 (YYYYMMDD)",
+                    "default": "19900101"
+                },
+                "cert_type": {
+                    "type": "string",
+                    "description": "간편인증 유형",
+                    "enum": ["kakao", "naver"],
+                    "default": "kakao"
+                },
+                "error_msg": {
+                    "type": "string",
+                    "description": "에러 메시지 (미입력시 기본 메시지 사용)",
+                    "default": ""
                 }
             }
-        ),
-        Tool(
-            name="scenario_build_cert_response_fail",
-            description="간편인증 완료 확인(cert_response) 실패 시나리오를 생성합니다. (cert_request 성공 후 cert_response 실패)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "user_name": {
-                        "type": "string",
-                        "description": "사용자 이름",
-                        "default": "테스트사용자"
-                    },
-                    "phone": {
-                        "type": "string",
-                        "description": "전화번호",
-                        "default": "01012345678"
-                    },
-                    "birthday": {
-                        "type": "string",
-                        "description": "생년월일 (YYYYMMDD)",
-                        "default": "19900101"
-                    },
-                    "cert_type": {
-                        "type": "string",
-                        "description": "간편인증 유형",
-                        "enum": ["kakao", "naver"],
-                        "default": "kakao"
-                    },
-                    "error_type": {
-                        "type": "string",
-                        "description": "에러 타입",
-                        "enum": ["간편인증토큰만료", "간편인증미완료", "간편인증오류"],
-                        "default": "간편인증미완료"
-                    },
-                    "error_msg": {
-                        "type": "string",
-                        "description": "에러 메시지 (미입력시 기본 메시지 사용)",
-                        "default": ""
-                    }
+        }
+    ),
+    Tool(
+        name="scenario_build_cert_response_fail",
+        description="간편인증 완료 확인(cert_response) 실패 시나리오를 생성합니다. (cert_request 성공 후 cert_response 실패)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "user_name": {
+                    "type": "string",
+                    "description": "사용자 이름",
+                    "default": "테스트사용자"
+                },
+                "phone": {
+                    "type": "string",
+                    "description": "전화번호",
+                    "default": "01012345678"
+                },
+                "birthday": {
+                    "type": "string",
+                    "description": "생년월일 (YYYYMMDD)",
+                    "default": "19900101"
+                },
+                "cert_type": {
+                    "type": "string",
+                    "description": "간편인증 유형",
+                    "enum": ["kakao", "naver"],
+                    "default": "kakao"
+                },
+                "error_type": {
+                    "type": "string",
+                    "description": "에러 타입",
+                    "enum": ["간편인증토큰만료", "간편인증미완료", "간편인증오류"],
+                    "default": "간편인증미완료"
+                },
+                "error_msg": {
+                    "type": "string",
+                    "description": "에러 메시지 (미입력시 기본 메시지 사용)",
+                    "default": ""
                 }
             }
-        ),
-    ]
+        }
+    ),
+]
+
+
+@server.list_tools()
+async def list_tools() -> list[Tool]:
+    """List available tools."""
+    return _TOOLS_CACHE
 
 
 @server.call_tool()
 async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
     """Handle tool calls."""
-    
-    if name == "template_list":
-        return await handle_template_list(arguments)
-    elif name == "template_load":
-        return await handle_template_load(arguments)
-    elif name == "scenario_build_normal":
-        return await handle_scenario_build_normal(arguments)
-    elif name == "scenario_build_error":
-        return await handle_scenario_build_error(arguments)
-    elif name == "scenario_build_progress":
-        return await handle_scenario_build_progress(arguments)
-    elif name == "scenario_validate":
-        return await handle_scenario_validate(arguments)
-    elif name == "scenario_assign":
-        return await handle_scenario_assign(arguments)
-    elif name == "scenario_unassign":
-        return await handle_scenario_unassign(arguments)
-    elif name == "error_types_list":
-        return await handle_error_types_list(arguments)
-    elif name == "scenario_build_simple_auth":
-        return await handle_scenario_build_simple_auth(arguments)
-    elif name == "scenario_build_common_cert":
-        return await handle_scenario_build_common_cert(arguments)
-    elif name == "scenario_build_corp_common_cert":
-        return await handle_scenario_build_corp_common_cert(arguments)
-    elif name == "scenario_build_simple_auth_fail":
-        return await handle_scenario_build_simple_auth_fail(arguments)
-    elif name == "scenario_build_cert_response_fail":
-        return await handle_scenario_build_cert_response_fail(arguments)
-    else:
+    handler = _TOOL_HANDLERS.get(name)
+    if handler is None:
         return [TextContent(type="text", text=f"Unknown tool: {name}")]
+    return await handler(arguments)
+
+
+@functools.lru_cache(maxsize=1)
+def _templates_by_category() -> dict[str, list[dict[str, Any]]]:
+    """카테고리별 템플릿 요약 인덱스 (최초 1회만 전체 순회, 이후 dict 조회)"""
+    buckets: dict[str, list[dict[str, Any]]] = {"normal": [], "error": [], "corp": [], "all": []}
+    for template_id, template_data in load_templates().items():
+        summary = {
+            "template_id": template_id,
+            "description": template_data.get("description", ""),
+            "total_refund": template_data.get("refund_result", {}).get("total_refund", 0),
+            "biz_type": template_data.get("biz_type", "unknown"),
+        }
+        buckets["all"].append(summary)
+        if "ERR" in template_id:
+            buckets["error"].append(summary)
+        else:
+            buckets["normal"].append(summary)
+        if "CORP" in template_id:
+            buckets["corp"].append(summary)
+    return buckets
+
+
+@functools.lru_cache(maxsize=8)
+def _template_list_json(category: str) -> str:
+    """카테고리별 템플릿 목록 JSON (불변이므로 직렬화 결과 자체를 캐시)"""
+    result = _templates_by_category()[category]
+    return _dumps({"templates": result, "count": len(result)})
+
+
+@functools.lru_cache(maxsize=128)
+def _dump_template(template_id: str) -> str:
+    """템플릿 본문 JSON (템플릿은 로드 후 불변이므로 직렬화 결과 재사용)"""
+    return _dumps(load_templates()[template_id])
+
+
+@functools.lru_cache(maxsize=1)
+def _templates_resource_json() -> str:
+    """scenario://templates 리소스 본문 (카테고리 인덱스의 전체 목록을 재사용)"""
+    return _dumps({"templates": _templates_by_category()["all"]})
 
 
 async def handle_template_list(arguments: dict[str, Any]) -> list[TextContent]:
     """Handle template_list tool."""
     category = arguments.get("category", "all")
-    templates = load_templates()
-    
-    result = []
-    for template_id, template_data in templates.items():
-        # 카테고리 필터링
-        if category != "all":
-            if category == "normal" and "ERR" in template_id:
-                continue
-            if category == "error" and "ERR" not in template_id:
-                continue
-            if category == "corp" and "CORP" not in template_id:
-                continue
-        
-        # 템플릿 요약 정보
-        refund_result = template_data.get("refund_result", {})
-        total_refund = refund_result.get("total_refund", 0)
-        biz_type = template_data.get("biz_type", "unknown")
-        description = template_data.get("description", "")
-        
-        result.append({
-            "template_id": template_id,
-            "description": description,
-            "total_refund": total_refund,
-            "biz_type": biz_type,
-        })
-    
-    return [TextContent(
-        type="text",
-        text=json.dumps({"templates": result, "count": len(result)}, ensure_ascii=False, indent=2)
-    )]
+    # 알 수 없는 카테고리는 기존 필터 동작과 동일하게 전체 목록으로 처리
+    if category not in _templates_by_category():
+        category = "all"
+    return [TextContent(type="text", text=_template_list_json(category))]
 
 
 async def handle_template_load(arguments: dict[str, Any]) -> list[TextContent]:
@@ -939,35 +1117,36 @@ async def handle_template_load(arguments: dict[str, Any]) -> list[TextContent]:
         available = list(templates.keys())
         return [TextContent(
             type="text",
-            text=json.dumps({
+            text=_dumps({
                 "error": f"Template not found: {template_id}",
                 "available_templates": available,
                 "note": f"Templates are loaded from: {get_templates_directory()}"
-            }, ensure_ascii=False, indent=2)
+            })
         )]
     
-    return [TextContent(
-        type="text",
-        text=json.dumps(templates[template_id], ensure_ascii=False, indent=2)
-    )]
+    return [TextContent(type="text", text=_dump_template(template_id))]
+
+
+# 핸들러별 (인자명, 기본값) 테이블 (핸들러 호출마다 기본값 리터럴을 재생성하지 않도록 모듈 상수화)
+_NORMAL_ARG_DEFAULTS = (
+    ("user_name", "테스트사용자"),
+    ("total_refund", 0),
+    ("biz_type", "individual_biz"),
+    ("login_method", "simple_auth"),
+    ("cert_type", "kakao"),
+    ("창중감_환급액", 0),
+    ("고용증대_환급액", 0),
+    ("사회보험료_환급액", 0),
+    ("양도세_환급액", 0),
+)
 
 
 async def handle_scenario_build_normal(arguments: dict[str, Any]) -> list[TextContent]:
     """Handle scenario_build_normal tool."""
-    user_name = arguments.get("user_name", "테스트사용자")
-    total_refund = arguments.get("total_refund", 0)
-    biz_type_str = arguments.get("biz_type", "individual_biz")
-    login_method_str = arguments.get("login_method", "simple_auth")
-    cert_type_str = arguments.get("cert_type", "kakao")
-    
-    biz_type = BizType(biz_type_str)
-    login_method = LoginMethod(login_method_str)
-    
-    # 환급 항목
-    창중감 = arguments.get("창중감_환급액", 0)
-    고용증대 = arguments.get("고용증대_환급액", 0)
-    사회보험료 = arguments.get("사회보험료_환급액", 0)
-    양도세 = arguments.get("양도세_환급액", 0)
+    user_name, total_refund, biz_type_str, login_method_str, cert_type_str, 창중감, 고용증대, 사회보험료, 양도세 = _pick(arguments, _NORMAL_ARG_DEFAULTS)
+
+    biz_type = BizType.from_value(biz_type_str)
+    login_method = LoginMethod.from_value(login_method_str)
     
     # 사용자 정보 생성
     user_info = UserInfo(name=user_name)
@@ -992,28 +1171,19 @@ async def handle_scenario_build_normal(arguments: dict[str, Any]) -> list[TextCo
         )
         
         scenario = ScenarioConfig(
+            scenario_id=f"NON_BIZ_{uuid.uuid4().hex[:8].upper()}",
             scenario_name=f"비사업자_{user_name}",
             description=f"{user_name}의 비사업자 시나리오 (사업자없음오류 발생, 양도세 환급액: {양도세:,}원)",
             user_info=user_info,
             taxpayer_info=taxpayer_info,
             biz_type=biz_type,
             refund_result=refund_result,
-            load_config=ActionConfig(
-                success=False,
-                error_type=ErrorType.NO_BIZ.value,
-                error_msg=ERROR_MESSAGES[ErrorType.NO_BIZ],
-                request_data=load_request,
-                response_data=load_response,
-            ),
+            load_config=_ac(False, load_request, load_response, ErrorType.NO_BIZ.value, ERROR_MESSAGES[ErrorType.NO_BIZ]),
         )
-        
-        # scenario_id가 없으면 자동 생성
-        if not scenario.scenario_id:
-            scenario.scenario_id = f"NON_BIZ_{uuid.uuid4().hex[:8].upper()}"
-        
+
         return [TextContent(
             type="text",
-            text=json.dumps(scenario.to_dict(), ensure_ascii=False, indent=2)
+            text=_scenario_json(scenario)
         )]
     
     # 정상 환급 시나리오 생성
@@ -1030,11 +1200,7 @@ async def handle_scenario_build_normal(arguments: dict[str, Any]) -> list[TextCo
         # 법인 로그인 방식에 따라 시나리오 생성
         if login_method == LoginMethod.CORP_COMMON_CERT:
             # 공동인증서 방식
-            common_cert = CommonCert(
-                sign_cert="base64_encoded_cert...",
-                sign_pri="base64_encoded_pri...",
-                sign_pw="cert_password",
-            )
+            common_cert = _STUB_COMMON_CERT
             corp_check_request = build_corp_check_request_data(
                 common_cert=common_cert,
             )
@@ -1046,97 +1212,40 @@ async def handle_scenario_build_normal(arguments: dict[str, Any]) -> list[TextCo
                 resno=arguments.get("resno", "1234567"),
             )
         
-        corp_check_response = build_corp_check_response(
-            success=True,
-            biz_name=arguments.get("biz_name", "주식회사 테스트사업자"),
-            biz_no=arguments.get("biz_no", "1234104321"),
-            ceo_name=arguments.get("ceo_name", "테스트대표자"),
-            tin=taxpayer_info.tin,
-        )
-        
-        corp_load_calc_request = build_corp_load_calc_request_data(
-            cookies=corp_check_response.get("result", {}).get("cookies"),
-            export_file_prefix=taxpayer_info.tin,
-            tin=taxpayer_info.tin,
-        )
-        corp_load_calc_response = build_corp_load_calc_response(
-            success=True,
-            result_data={
-                "계산결과": {
-                    "총납부세액": 0.0,
-                    "미래절세효과": 0.0,
-                }
-            }
-        )
-        
         scenario = ScenarioConfig(
+            scenario_id=f"CORP_{uuid.uuid4().hex[:8].upper()}",
             scenario_name=f"법인정상환급_{user_name}_{total_refund}원",
             description=f"[법인] {login_method.value} 로그인: {user_name}의 정상 환급 시나리오 (총 {total_refund:,}원)",
             user_info=user_info,
             taxpayer_info=taxpayer_info,
             biz_type=biz_type,
             refund_result=refund_result,
-            corp_check_config=ActionConfig(
-                success=True,
-                request_data=corp_check_request,
-                response_data=corp_check_response,
-            ),
-            corp_load_calc_config=ActionConfig(
-                success=True,
-                request_data=corp_load_calc_request,
-                response_data=corp_load_calc_response,
+            **_corp_success_configs(
+                corp_check_request,
+                arguments.get("biz_name", "주식회사 테스트사업자"),
+                arguments.get("biz_no", "1234104321"),
+                arguments.get("ceo_name", "테스트대표자"),
+                taxpayer_info,
             ),
         )
-        
-        # scenario_id가 없으면 자동 생성
-        if not scenario.scenario_id:
-            scenario.scenario_id = f"CORP_{uuid.uuid4().hex[:8].upper()}"
-        
+
         return [TextContent(
             type="text",
-            text=json.dumps(scenario.to_dict(), ensure_ascii=False, indent=2)
+            text=_scenario_json(scenario)
         )]
     
     # 개인사업자인 경우
+    biz_prefix = "INDIVIDUAL_BIZ" if biz_type == BizType.INDIVIDUAL_BIZ else "CORP"
+    scenario_id = f"{biz_prefix}_{uuid.uuid4().hex[:8].upper()}"
+
     # 로그인 방식에 따라 시나리오 생성
     if login_method == LoginMethod.SIMPLE_AUTH:
         # 간편인증 방식: cert_request -> cert_response -> check -> load
-        user_info.cert_type = cert_type_str
-        cert_info = CertInfo(
-            cert_type=CertType(cert_type_str),
-            req_tx_id="7cd3...",
-            token="eyJh...",
-            cx_id="10db...",
-        )
-        
-        # 1. cert_request
-        cert_request_data = build_cert_request_data(user_info=user_info)
-        cert_request_response = build_cert_request_response(success=True, cert_info=cert_info)
-        
-        # 2. cert_response
-        cert_response_data = build_cert_response_data(user_info=user_info, cert_info=cert_info)
-        auth_token = "eyJh..."
-        cert_response_response = build_cert_response_response(success=True, token=auth_token)
-        
-        # 3. check
-        check_request = build_check_request_data(token=auth_token)
-        check_response = build_check_response(
-            success=True,
-            tin=taxpayer_info.tin,
-        )
-        
-        # 4. load
-        load_request = build_load_request_data(
-            cookies=check_response.get("result", {}).get("cookies"),
-            export_file_prefix=taxpayer_info.tin,
-        )
-        load_response = build_load_response(
-            success=True,
-            refund_result=refund_result,
-            taxpayer_info=taxpayer_info,
-        )
-        
+        user_info = UserInfo(name=user_name, cert_type=cert_type_str)
+        cert_info = _STUB_CERT_INFO[cert_type_str]
+
         scenario = ScenarioConfig(
+            scenario_id=scenario_id,
             scenario_name=f"정상환급_간편인증_{user_name}_{total_refund}원",
             description=f"[개인] 간편인증({cert_type_str}) 로그인: {user_name}의 정상 환급 시나리오 (총 {total_refund:,}원)",
             user_info=user_info,
@@ -1144,287 +1253,199 @@ async def handle_scenario_build_normal(arguments: dict[str, Any]) -> list[TextCo
             cert_info=cert_info,
             biz_type=biz_type,
             refund_result=refund_result,
-            cert_request_config=ActionConfig(
-                success=True,
-                request_data=cert_request_data,
-                response_data=cert_request_response,
-            ),
-            cert_response_config=ActionConfig(
-                success=True,
-                request_data=cert_response_data,
-                response_data=cert_response_response,
-            ),
-            check_config=ActionConfig(
-                success=True,
-                request_data=check_request,
-                response_data=check_response,
-            ),
-            load_config=ActionConfig(
-                success=True,
-                request_data=load_request,
-                response_data=load_response,
-            ),
+            **_simple_auth_success_configs(user_info, cert_info, taxpayer_info, refund_result),
         )
     else:  # COMMON_CERT
         # 공동인증서 방식: check -> load
-        common_cert = CommonCert(
-            sign_cert="base64_encoded_cert...",
-            sign_pri="base64_encoded_pri...",
-            sign_pw="cert_password",
-        )
-        
-        # 1. check
-        check_request = build_check_request_data(common_cert=common_cert)
-        check_response = build_check_response(
-            success=True,
-            tin=taxpayer_info.tin,
-        )
-        
-        # 2. load
-        load_request = build_load_request_data(
-            cookies=check_response.get("result", {}).get("cookies"),
-            export_file_prefix=taxpayer_info.tin,
-        )
-        load_response = build_load_response(
-            success=True,
-            refund_result=refund_result,
-            taxpayer_info=taxpayer_info,
-        )
-        
         scenario = ScenarioConfig(
+            scenario_id=scenario_id,
             scenario_name=f"정상환급_공동인증서_{user_name}_{total_refund}원",
             description=f"[개인] 공동인증서 로그인: {user_name}의 정상 환급 시나리오 (총 {total_refund:,}원)",
             user_info=user_info,
             taxpayer_info=taxpayer_info,
             biz_type=biz_type,
             refund_result=refund_result,
-            check_config=ActionConfig(
-                success=True,
-                request_data=check_request,
-                response_data=check_response,
-            ),
-            load_config=ActionConfig(
-                success=True,
-                request_data=load_request,
-                response_data=load_response,
+            **_check_load_success_configs(
+                build_check_request_data(common_cert=_STUB_COMMON_CERT),
+                taxpayer_info,
+                refund_result,
             ),
         )
-    
-    # scenario_id가 없으면 자동 생성
-    if not scenario.scenario_id:
-        biz_prefix = "INDIVIDUAL_BIZ" if biz_type == BizType.INDIVIDUAL_BIZ else "CORP"
-        scenario.scenario_id = f"{biz_prefix}_{uuid.uuid4().hex[:8].upper()}"
-    
+
     return [TextContent(
         type="text",
-        text=json.dumps(scenario.to_dict(), ensure_ascii=False, indent=2)
+        text=_scenario_json(scenario)
     )]
 
 
+@functools.lru_cache(maxsize=256)
+def _default_error_response(action_str: str, error_type_value: str) -> dict[str, Any]:
+    """기본 에러 메시지를 쓰는 (액션, 에러타입) 조합의 실패 응답 캐시"""
+    build_response = _ERROR_ACTION_BUILDERS.get(action_str, _ERROR_ACTION_BUILDERS["load"])[2]
+    return build_response(
+        success=False,
+        error_type=error_type_value,
+        error_msg=get_error_message(_ERROR_TYPE_BY_VALUE[error_type_value]),
+    )
+
+
+_ERROR_ARG_DEFAULTS = (
+    ("user_name", "테스트사용자"),
+    ("error_type", ""),
+    ("error_msg", ""),
+    ("action", ""),
+)
+
+
 async def handle_scenario_build_error(arguments: dict[str, Any]) -> list[TextContent]:
     """Handle scenario_build_error tool."""
-    user_name = arguments.get("user_name", "테스트사용자")
-    error_type_str = arguments.get("error_type", "")
-    error_msg = arguments.get("error_msg", "")
-    action_str = arguments.get("action", "")
+    user_name, error_type_str, error_msg, action_str = _pick(arguments, _ERROR_ARG_DEFAULTS)
     
-    try:
-        error_type = ErrorType(error_type_str)
-    except ValueError:
+    error_type = _ERROR_TYPE_BY_VALUE.get(error_type_str)
+    if error_type is None:
         return [TextContent(
             type="text",
-            text=json.dumps({
+            text=_dumps({
                 "error": f"Unknown error type: {error_type_str}",
-                "available_types": [e.value for e in ErrorType]
-            }, ensure_ascii=False, indent=2)
+                "available_types": list(_ERROR_TYPE_VALUES)
+            })
         )]
     
-    # 기본 메시지 사용 (환경변수 고려)
-    if not error_msg:
+    # 기본 메시지/액션 여부 (기본 메시지면 응답 캐시를 탈 수 있음)
+    use_default_msg = not error_msg
+    if use_default_msg:
         error_msg = get_error_message(error_type)
-    
+
     # 기본 액션 사용
     if not action_str:
         action_type = ERROR_DEFAULT_ACTION.get(error_type, ActionType.LOAD)
         action_str = action_type.value
-    
+
     # 사용자 정보 생성
     user_info = UserInfo(name=user_name)
-    
+
     # 시나리오 생성
-    scenario = ScenarioConfig(
-        scenario_name=f"에러_{error_type.value}_{user_name}",
-        description=f"{user_name}의 {error_type.value} 에러 시나리오",
-        user_info=user_info,
+    # 해당 액션에 에러 설정 및 요청/응답 데이터 생성 (테이블 디스패치, 미지정 액션은 load)
+    config_field, build_request, build_response = _ERROR_ACTION_BUILDERS.get(
+        action_str, _ERROR_ACTION_BUILDERS["load"]
     )
-    
-    # 해당 액션에 에러 설정 및 요청/응답 데이터 생성
-    if action_str == "cert_request":
-        request_data = build_cert_request_data(user_info=user_info)
-        response_data = build_cert_request_response(
-            success=False,
-            error_type=error_type.value,
-            error_msg=error_msg,
-        )
-        scenario.cert_request_config = ActionConfig(
-            success=False,
-            error_type=error_type.value,
-            error_msg=error_msg,
-            request_data=request_data,
-            response_data=response_data,
-        )
-    elif action_str == "cert_response":
-        cert_info = CertInfo()
-        request_data = build_cert_response_data(user_info=user_info, cert_info=cert_info)
-        response_data = build_cert_response_response(
-            success=False,
-            error_type=error_type.value,
-            error_msg=error_msg,
-        )
-        scenario.cert_response_config = ActionConfig(
-            success=False,
-            error_type=error_type.value,
-            error_msg=error_msg,
-            request_data=request_data,
-            response_data=response_data,
-        )
-    elif action_str == "check":
-        request_data = build_check_request_data()
-        response_data = build_check_response(
-            success=False,
-            error_type=error_type.value,
-            error_msg=error_msg,
-        )
-        scenario.check_config = ActionConfig(
-            success=False,
-            error_type=error_type.value,
-            error_msg=error_msg,
-            request_data=request_data,
-            response_data=response_data,
-        )
-    else:  # load
-        taxpayer_info = TaxpayerInfo()
-        request_data = build_load_request_data(export_file_prefix=taxpayer_info.tin)
-        response_data = build_load_response(
-            success=False,
-            error_type=error_type.value,
-            error_msg=error_msg,
-        )
-        scenario.load_config = ActionConfig(
+    request_data = build_request(user_info)
+    if use_default_msg:
+        # (액션, 에러타입)만의 함수이므로 캐시된 응답 재사용 (직렬화 전까지 변형 없음)
+        response_data = _default_error_response(action_str, error_type.value)
+    else:
+        response_data = build_response(
             success=False,
             error_type=error_type.value,
             error_msg=error_msg,
-            request_data=request_data,
-            response_data=response_data,
         )
-    
+
+    scenario = ScenarioConfig(
+        scenario_name=f"에러_{error_type.value}_{user_name}",
+        description=f"{user_name}의 {error_type.value} 에러 시나리오",
+        user_info=user_info,
+        **{config_field: _ac(False, request_data, response_data, error_type.value, error_msg)},
+    )
+
     return [TextContent(
         type="text",
-        text=json.dumps(scenario.to_dict(), ensure_ascii=False, indent=2)
+        text=_scenario_json(scenario)
     )]
 
 
+# 기본 진행률 단계 (ProgressStep은 불변이므로 임포트 시 한 번만 생성해 공유)
+_DEFAULT_PROGRESS_STEPS: tuple[ProgressStep, ...] = (
+    ProgressStep(step_name="홈택스 로그인", progress="10%", delay_seconds=0.5),
+    ProgressStep(step_name="신고내역 조회", progress="30%", delay_seconds=1.0),
+    ProgressStep(step_name="환급액 계산", progress="60%", delay_seconds=1.5),
+    ProgressStep(step_name="결과 생성", progress="90%", delay_seconds=0.5),
+)
+
+
+_PROGRESS_ARG_DEFAULTS = (
+    ("user_name", "테스트사용자"),
+    ("total_refund", 0),
+    ("queue_name", "refund-search.fifo"),
+    ("steps", ()),
+)
+
+
 async def handle_scenario_build_progress(arguments: dict[str, Any]) -> list[TextContent]:
     """Handle scenario_build_progress tool."""
-    user_name = arguments.get("user_name", "테스트사용자")
-    total_refund = arguments.get("total_refund", 0)
-    queue_name = arguments.get("queue_name", "refund-search.fifo")
-    steps_data = arguments.get("steps", [])
-    
-    # 기본 진행률 단계
-    if not steps_data:
-        steps_data = [
-            {"step_name": "홈택스 로그인", "progress": "10%", "delay_seconds": 0.5},
-            {"step_name": "신고내역 조회", "progress": "30%", "delay_seconds": 1.0},
-            {"step_name": "환급액 계산", "progress": "60%", "delay_seconds": 1.5},
-            {"step_name": "결과 생성", "progress": "90%", "delay_seconds": 0.5},
+    user_name, total_refund, queue_name, steps_data = _pick(arguments, _PROGRESS_ARG_DEFAULTS)
+
+    if steps_data:
+        steps = [
+            ProgressStep(
+                step_name=s.get("step_name", ""),
+                progress=s.get("progress", "0%"),
+                delay_seconds=s.get("delay_seconds", 0.5),
+            )
+            for s in steps_data
         ]
-    
-    steps = [
-        ProgressStep(
-            step_name=s.get("step_name", ""),
-            progress=s.get("progress", "0%"),
-            delay_seconds=s.get("delay_seconds", 0.5),
-        )
-        for s in steps_data
-    ]
+    else:
+        steps = list(_DEFAULT_PROGRESS_STEPS)
     
     user_info = UserInfo(name=user_name)
     taxpayer_info = TaxpayerInfo()
     refund_result = RefundResult(total_refund=total_refund)
     
-    # check 액션 요청/응답 데이터 생성
-    check_request = build_check_request_data(user_ern="")
-    check_response = build_check_response(
-        success=True,
-        tin=taxpayer_info.tin,
-    )
-    
-    # load 액션 요청/응답 데이터 생성
-    load_request = build_load_request_data(
-        cookies=check_response.get("result", {}).get("cookies"),
-        export_file_prefix=taxpayer_info.tin,
-        use_sqs=True,
-    )
-    load_response = build_load_response(
-        success=True,
-        refund_result=refund_result,
-        taxpayer_info=taxpayer_info,
-    )
-    
     scenario = ScenarioConfig(
         scenario_name=f"진행률테스트_{user_name}",
         description=f"{user_name}의 진행률 전송 테스트 시나리오",
         user_info=user_info,
         taxpayer_info=taxpayer_info,
         refund_result=refund_result,
-        check_config=ActionConfig(
-            success=True,
-            request_data=check_request,
-            response_data=check_response,
-        ),
-        load_config=ActionConfig(
-            success=True,
-            request_data=load_request,
-            response_data=load_response,
-        ),
         progress_config=ProgressConfig(
             enabled=True,
             queue_name=queue_name,
             steps=steps,
         ),
+        **_check_load_success_configs(
+            build_check_request_data(user_ern=""), taxpayer_info, refund_result, use_sqs=True
+        ),
     )
     
     return [TextContent(
         type="text",
-        text=json.dumps(scenario.to_dict(), ensure_ascii=False, indent=2)
+        text=_scenario_json(scenario)
     )]
 
 
+# 필드 형식 검증용 정규식 (호출마다 컴파일하지 않도록 모듈 레벨에서 1회 컴파일)
+_RE_PHONE = re.compile(r"\d{11}")
+_RE_BIRTHDAY = re.compile(r"\d{8}")
+_RE_TIN = re.compile(r"\d{18}")
+
+
 async def handle_scenario_validate(arguments: dict[str, Any]) -> list[TextContent]:
     """Handle scenario_validate tool."""
     scenario_data = arguments.get("scenario", {})
-    
+
     errors = []
     warnings = []
-    
+
     try:
+        # model_validate는 클래스에 캐시된 pydantic-core 검증기를 그대로 사용
         scenario = ScenarioConfig.from_dict(scenario_data)
-        
+
         # 추가 검증
         if scenario.biz_type == BizType.INDIVIDUAL_BIZ:
             if scenario.refund_result.total_refund == 0:
                 warnings.append("개인사업자 시나리오인데 환급액이 0원입니다.")
-        
-        if scenario.user_info.phone and len(scenario.user_info.phone) != 11:
+
+        phone = scenario.user_info.phone
+        if phone and not _RE_PHONE.fullmatch(phone):
             warnings.append("전화번호가 11자리가 아닙니다.")
-        
-        if scenario.user_info.birthday and len(scenario.user_info.birthday) != 8:
+
+        birthday = scenario.user_info.birthday
+        if birthday and not _RE_BIRTHDAY.fullmatch(birthday):
             errors.append("생년월일은 YYYYMMDD 형식이어야 합니다.")
-        
-        if scenario.taxpayer_info.tin and len(scenario.taxpayer_info.tin) != 18:
+
+        tin = scenario.taxpayer_info.tin
+        if tin and not _RE_TIN.fullmatch(tin):
             errors.append("납세자관리번호는 18자리여야 합니다.")
-        
+
     except Exception as e:
         errors.append(f"시나리오 파싱 오류: {str(e)}")
     
@@ -1436,7 +1457,7 @@ async def handle_scenario_validate(arguments: dict[str, Any]) -> list[TextConten
     
     return [TextContent(
         type="text",
-        text=json.dumps(result, ensure_ascii=False, indent=2)
+        text=_dumps(result)
     )]
 
 
@@ -1452,6 +1473,45 @@ def convert_floats_to_decimal(obj: Any) -> Any:
         return obj
 
 
+@functools.lru_cache(maxsize=1)
+def _get_table() -> Any:
+    """DynamoDB 테이블 핸들 생성 (세션/자격증명 체인 비용이 커서 프로세스당 1회만)"""
+    endpoint_url = os.environ.get("DYNAMODB_ENDPOINT_URL")
+    table_name = os.environ.get("SCENARIO_TABLE_NAME", "mock-itr-scenarios")
+    region = os.environ.get("AWS_REGION", "ap-northeast-2")
+    # 커넥션 풀을 키워 핸들러 간 TLS 연결을 재사용
+    config = BotoConfig(max_pool_connections=32, retries={"mode": "adaptive"})
+
+    if endpoint_url:
+        dynamodb = boto3.resource(
+            "dynamodb", endpoint_url=endpoint_url, region_name=region, config=config
+        )
+    else:
+        dynamodb = boto3.resource("dynamodb", region_name=region, config=config)
+
+    return dynamodb.Table(table_name)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_client() -> Any:
+    """저수준 DynamoDB 클라이언트 (Table 리소스의 타입 변환 계층 없이 직접 호출)"""
+    endpoint_url = os.environ.get("DYNAMODB_ENDPOINT_URL")
+    region = os.environ.get("AWS_REGION", "ap-northeast-2")
+    config = BotoConfig(max_pool_connections=32, retries={"mode": "adaptive"})
+
+    if endpoint_url:
+        return boto3.client(
+            "dynamodb", endpoint_url=endpoint_url, region_name=region, config=config
+        )
+    return boto3.client("dynamodb", region_name=region, config=config)
+
+
+@functools.lru_cache(maxsize=128)
+def _template_ddb_item(template_id: str) -> dict[str, Any]:
+    """템플릿의 Decimal 변환 결과 캐시 (템플릿은 불변이므로 assign마다 재변환 불필요)"""
+    return convert_floats_to_decimal(load_templates()[template_id])
+
+
 async def handle_scenario_assign(arguments: dict[str, Any]) -> list[TextContent]:
     """Handle scenario_assign tool."""
     user_ern = arguments.get("user_ern", "")
@@ -1461,7 +1521,7 @@ async def handle_scenario_assign(arguments: dict[str, Any]) -> list[TextContent]
     if not user_ern:
         return [TextContent(
             type="text",
-            text=json.dumps({"error": "user_ern is required"}, ensure_ascii=False)
+            text=_dumps({"error": "user_ern is required"})
         )]
     
     # 시나리오 결정
@@ -1472,17 +1532,17 @@ async def handle_scenario_assign(arguments: dict[str, Any]) -> list[TextContent]
         if template_id not in templates:
             return [TextContent(
                 type="text",
-                text=json.dumps({
+                text=_dumps({
                     "error": f"Template not found: {template_id}",
                     "available_templates": list(templates.keys()),
                     "note": f"Templates are loaded from: {get_templates_directory()}"
-                }, ensure_ascii=False, indent=2)
+                })
             )]
         scenario = templates[template_id]
     else:
         return [TextContent(
             type="text",
-            text=json.dumps({"error": "Either scenario or template_id is required"}, ensure_ascii=False)
+            text=_dumps({"error": "Either scenario or template_id is required"})
         )]
     
     # scenario_id가 없거나 비어있으면 자동 생성
@@ -1493,26 +1553,16 @@ async def handle_scenario_assign(arguments: dict[str, Any]) -> list[TextContent]
     
     # DynamoDB 저장 시도
     try:
-        import boto3
-        
-        endpoint_url = os.environ.get("DYNAMODB_ENDPOINT_URL")
-        table_name = os.environ.get("SCENARIO_TABLE_NAME", "mock-itr-scenarios")
-        region = os.environ.get("AWS_REGION", "ap-northeast-2")
-        
-        if endpoint_url:
-            dynamodb = boto3.resource("dynamodb", endpoint_url=endpoint_url, region_name=region)
-        else:
-            dynamodb = boto3.resource("dynamodb", region_name=region)
-        
-        table = dynamodb.Table(table_name)
-        
+        table = _get_table()
+
         # 기존 user_ern이 있는지 확인
         existing_item = None
         try:
-            response = table.get_item(Key={"user_ern": user_ern})
+            # 동기 네트워크 호출이 이벤트 루프를 막지 않도록 스레드로 위임
+            response = await asyncio.to_thread(table.get_item, Key={"user_ern": user_ern})
             existing_item = response.get("Item")
         except Exception as e:
-            logger.warning(f"기존 항목 조회 실패 (무시하고 계속 진행): {str(e)}")
+            logger.warning("기존 항목 조회 실패 (무시하고 계속 진행): %s", e)
         
         # 기존 항목이 있고 scenario_config가 있으면 최신 scenario 사용
         if existing_item and existing_item.get("scenario_config"):
@@ -1523,17 +1573,18 @@ async def handle_scenario_assign(arguments: dict[str, Any]) -> list[TextContent]
             if existing_scenario_id:
                 scenario_id = existing_scenario_id
                 scenario["scenario_id"] = scenario_id
-                logger.info(f"기존 시나리오 발견: {scenario_id}, 최신 시나리오로 업데이트합니다.")
+                logger.info("기존 시나리오 발견: %s, 최신 시나리오로 업데이트합니다.", scenario_id)
             else:
-                logger.info(f"기존 항목이 있지만 scenario_id가 없습니다. 새 시나리오를 생성합니다.")
-        
-        # float를 Decimal로 변환
-        scenario_converted = convert_floats_to_decimal(scenario)
+                logger.info("기존 항목이 있지만 scenario_id가 없습니다. 새 시나리오를 생성합니다.")
         
+        # float를 Decimal로 변환 (템플릿 기반이면 캐시된 변환 결과를 얕은 복사로 재사용)
+        if scenario_data:
+            scenario_converted = convert_floats_to_decimal(scenario)
+        else:
+            scenario_converted = dict(_template_ddb_item(template_id))
+
         # scenario_id를 최상위 레벨에도 포함 (DynamoDB 테이블 스키마 요구사항)
-        # scenario_converted에도 scenario_id가 포함되어 있는지 확인
-        if not scenario_converted.get("scenario_id"):
-            scenario_converted["scenario_id"] = scenario_id
+        scenario_converted["scenario_id"] = scenario_id
         
         # 할당 시간 추가 (ISO 8601 형식)
         assigned_at = datetime.now(timezone.utc).isoformat()
@@ -1545,28 +1596,28 @@ async def handle_scenario_assign(arguments: dict[str, Any]) -> list[TextContent]
             "assigned_at": assigned_at,
         }
         
-        table.put_item(Item=item)
+        await asyncio.to_thread(table.put_item, Item=item)
         
         return [TextContent(
             type="text",
-            text=json.dumps({
+            text=_dumps({
                 "success": True,
                 "user_ern": user_ern,
                 "message": f"시나리오가 {user_ern}에 할당되었습니다."
-            }, ensure_ascii=False, indent=2)
+            })
         )]
         
     except Exception as e:
         # DynamoDB 연결 실패시 JSON 출력
         return [TextContent(
             type="text",
-            text=json.dumps({
+            text=_dumps({
                 "success": False,
-                "error": f"DynamoDB 저장 실패: {str(e)}",
+                "error": f"DynamoDB 저장 실패: {str(e)[:2048]}",
                 "user_ern": user_ern,
                 "scenario": scenario,
                 "note": "DynamoDB에 저장하지 못했습니다. 위 시나리오를 수동으로 저장해주세요."
-            }, ensure_ascii=False, indent=2)
+            })
         )]
 
 
@@ -1577,76 +1628,89 @@ async def handle_scenario_unassign(arguments: dict[str, Any]) -> list[TextConten
     if not user_ern:
         return [TextContent(
             type="text",
-            text=json.dumps({"error": "user_ern is required"}, ensure_ascii=False)
+            text=_dumps({"error": "user_ern is required"})
         )]
     
     try:
-        import boto3
-        
-        endpoint_url = os.environ.get("DYNAMODB_ENDPOINT_URL")
+        # 단일 문자열 키 삭제라 리소스 계층의 직렬화/역직렬화가 순수 오버헤드
         table_name = os.environ.get("SCENARIO_TABLE_NAME", "mock-itr-scenarios")
-        region = os.environ.get("AWS_REGION", "ap-northeast-2")
-        
-        if endpoint_url:
-            dynamodb = boto3.resource("dynamodb", endpoint_url=endpoint_url, region_name=region)
-        else:
-            dynamodb = boto3.resource("dynamodb", region_name=region)
-        
-        table = dynamodb.Table(table_name)
-        table.delete_item(Key={"user_ern": user_ern})
+        # boto3는 블로킹이므로 스레드로 넘겨 이벤트 루프가 다른 요청을 처리하게 함
+        await asyncio.to_thread(
+            _get_client().delete_item,
+            TableName=table_name,
+            Key={"user_ern": {"S": user_ern}},
+        )
         
         return [TextContent(
             type="text",
-            text=json.dumps({
+            text=_dumps({
                 "success": True,
                 "user_ern": user_ern,
                 "message": f"{user_ern}의 시나리오 할당이 해제되었습니다."
-            }, ensure_ascii=False, indent=2)
+            })
         )]
         
     except Exception as e:
         return [TextContent(
             type="text",
-            text=json.dumps({
+            text=_dumps({
                 "success": False,
-                "error": f"DynamoDB 삭제 실패: {str(e)}",
+                "error": f"DynamoDB 삭제 실패: {str(e)[:2048]}",
                 "user_ern": user_ern,
-            }, ensure_ascii=False, indent=2)
+            })
         )]
 
 
+# 에러 타입 목록은 모듈 상수만으로 결정되므로 임포트 시 한 번만 구성/직렬화
+# (값 문자열/기본 액션 해석도 여기서 1회만 수행해 두 상수가 공유)
+_ERROR_TYPE_ROWS: tuple[tuple[str, Any], ...] = tuple(
+    (e.value, get_error_info(e)) for e in ErrorType
+)
+_ERROR_TYPES_JSON = _dumps({
+    "error_types": sorted(
+        [
+            {
+                "type": value,
+                "message": info.message,
+                "alt_messages": info.alt_messages,
+                "default_action": info.default_action.value,
+                "frequency": info.frequency,  # 샘플 데이터 기반 빈도
+            }
+            for value, info in _ERROR_TYPE_ROWS
+        ],
+        key=itemgetter("frequency"),  # 빈도순 정렬
+        reverse=True,
+    )
+})
+_ERROR_TYPES_RESOURCE_JSON = _dumps({
+    "error_types": [
+        {
+            "type": value,
+            "message": info.message,
+            "default_action": info.default_action.value,
+        }
+        for value, info in _ERROR_TYPE_ROWS
+    ]
+})
+
+
 async def handle_error_types_list(arguments: dict[str, Any]) -> list[TextContent]:
     """Handle error_types_list tool."""
-    error_types = []
-    
-    for error_type in ErrorType:
-        default_action = ERROR_DEFAULT_ACTION.get(error_type, ActionType.LOAD)
-        alt_messages = ERROR_MESSAGES_ALT.get(error_type, [])
-        frequency = ERROR_FREQUENCY.get(error_type, 0)
-        error_types.append({
-            "type": error_type.value,
-            "message": get_error_message(error_type),
-            "alt_messages": alt_messages,
-            "default_action": default_action.value,
-            "frequency": frequency,  # 샘플 데이터 기반 빈도
-        })
-    
-    # 빈도순 정렬
-    error_types.sort(key=lambda x: x["frequency"], reverse=True)
-    
-    return [TextContent(
-        type="text",
-        text=json.dumps({"error_types": error_types}, ensure_ascii=False, indent=2)
-    )]
+    return [TextContent(type="text", text=_ERROR_TYPES_JSON)]
+
+
+_SIMPLE_AUTH_ARG_DEFAULTS = (
+    ("user_name", "테스트사용자"),
+    ("phone", "01012345678"),
+    ("birthday", "19900101"),
+    ("cert_type", "kakao"),
+    ("total_refund", 0),
+)
 
 
 async def handle_scenario_build_simple_auth(arguments: dict[str, Any]) -> list[TextContent]:
     """[개인] 간편인증 flow 시나리오 생성: cert_request -> cert_response -> check -> load"""
-    user_name = arguments.get("user_name", "테스트사용자")
-    phone = arguments.get("phone", "01012345678")
-    birthday = arguments.get("birthday", "19900101")
-    cert_type = arguments.get("cert_type", "kakao")
-    total_refund = arguments.get("total_refund", 0)
+    user_name, phone, birthday, cert_type, total_refund = _pick(arguments, _SIMPLE_AUTH_ARG_DEFAULTS)
     
     # 사용자 정보 생성
     user_info = UserInfo(
@@ -1657,40 +1721,9 @@ async def handle_scenario_build_simple_auth(arguments: dict[str, Any]) -> list[T
     )
     taxpayer_info = TaxpayerInfo()
     refund_result = RefundResult(total_refund=total_refund)
-    
-    # 1. cert_request: 간편인증 요청
-    cert_request_data = build_cert_request_data(user_info=user_info)
-    cert_info = CertInfo(
-        cert_type=CertType(cert_type),
-        req_tx_id="7cd3...",
-        token="eyJh...",
-        cx_id="10db...",
-    )
-    cert_request_response = build_cert_request_response(success=True, cert_info=cert_info)
-    
-    # 2. cert_response: 간편인증 완료 (token 반환)
-    cert_response_data = build_cert_response_data(user_info=user_info, cert_info=cert_info)
-    auth_token = "eyJh..."  # cert_response에서 반환되는 token
-    cert_response_response = build_cert_response_response(success=True, token=auth_token)
-    
-    # 3. check: token으로 tin, cookies 반환
-    check_request = build_check_request_data(token=auth_token)
-    check_response = build_check_response(
-        success=True,
-        tin=taxpayer_info.tin,
-    )
-    
-    # 4. load: cookies로 수집 및 계산
-    load_request = build_load_request_data(
-        cookies=check_response.get("result", {}).get("cookies"),
-        export_file_prefix=taxpayer_info.tin,
-    )
-    load_response = build_load_response(
-        success=True,
-        refund_result=refund_result,
-        taxpayer_info=taxpayer_info,
-    )
-    
+    cert_info = _STUB_CERT_INFO[cert_type]
+
+    # cert_request -> cert_response -> check -> load 성공 flow
     scenario = ScenarioConfig(
         scenario_name=f"간편인증_{user_name}_{total_refund}원",
         description=f"[개인] 간편인증 flow: {user_name}의 환급 시나리오 (총 {total_refund:,}원)",
@@ -1699,31 +1732,12 @@ async def handle_scenario_build_simple_auth(arguments: dict[str, Any]) -> list[T
         cert_info=cert_info,
         biz_type=BizType.INDIVIDUAL_BIZ,
         refund_result=refund_result,
-        cert_request_config=ActionConfig(
-            success=True,
-            request_data=cert_request_data,
-            response_data=cert_request_response,
-        ),
-        cert_response_config=ActionConfig(
-            success=True,
-            request_data=cert_response_data,
-            response_data=cert_response_response,
-        ),
-        check_config=ActionConfig(
-            success=True,
-            request_data=check_request,
-            response_data=check_response,
-        ),
-        load_config=ActionConfig(
-            success=True,
-            request_data=load_request,
-            response_data=load_response,
-        ),
+        **_simple_auth_success_configs(user_info, cert_info, taxpayer_info, refund_result),
     )
     
     return [TextContent(
         type="text",
-        text=json.dumps(scenario.to_dict(), ensure_ascii=False, indent=2)
+        text=_scenario_json(scenario)
     )]
 
 
@@ -1736,31 +1750,7 @@ async def handle_scenario_build_common_cert(arguments: dict[str, Any]) -> list[T
     taxpayer_info = TaxpayerInfo()
     refund_result = RefundResult(total_refund=total_refund)
     
-    # 공동인증서 정보
-    common_cert = CommonCert(
-        sign_cert="base64_encoded_cert...",
-        sign_pri="base64_encoded_pri...",
-        sign_pw="cert_password",
-    )
-    
-    # 1. check: 공동인증서로 tin, cookies 반환
-    check_request = build_check_request_data(common_cert=common_cert)
-    check_response = build_check_response(
-        success=True,
-        tin=taxpayer_info.tin,
-    )
-    
-    # 2. load: cookies로 수집 및 계산
-    load_request = build_load_request_data(
-        cookies=check_response.get("result", {}).get("cookies"),
-        export_file_prefix=taxpayer_info.tin,
-    )
-    load_response = build_load_response(
-        success=True,
-        refund_result=refund_result,
-        taxpayer_info=taxpayer_info,
-    )
-    
+    # 공동인증서 check -> load 성공 flow
     scenario = ScenarioConfig(
         scenario_name=f"공동인증서_{user_name}_{total_refund}원",
         description=f"[개인] 공동인증서 flow: {user_name}의 환급 시나리오 (총 {total_refund:,}원)",
@@ -1768,42 +1758,38 @@ async def handle_scenario_build_common_cert(arguments: dict[str, Any]) -> list[T
         taxpayer_info=taxpayer_info,
         biz_type=BizType.INDIVIDUAL_BIZ,
         refund_result=refund_result,
-        check_config=ActionConfig(
-            success=True,
-            request_data=check_request,
-            response_data=check_response,
-        ),
-        load_config=ActionConfig(
-            success=True,
-            request_data=load_request,
-            response_data=load_response,
+        **_check_load_success_configs(
+            build_check_request_data(common_cert=_STUB_COMMON_CERT),
+            taxpayer_info,
+            refund_result,
         ),
     )
     
     return [TextContent(
         type="text",
-        text=json.dumps(scenario.to_dict(), ensure_ascii=False, indent=2)
+        text=_scenario_json(scenario)
     )]
 
 
+_CORP_ARG_DEFAULTS = (
+    ("biz_name", "주식회사 테스트사업자"),
+    ("biz_no", "1234104321"),
+    ("ceo_name", "테스트대표자"),
+    ("login_method", "corp_common_cert"),
+)
+
+
 async def handle_scenario_build_corp_common_cert(arguments: dict[str, Any]) -> list[TextContent]:
     """[법인] 공동인증서 또는 ID/PW flow 시나리오 생성: corp_check -> corp_load_calc"""
-    biz_name = arguments.get("biz_name", "주식회사 테스트사업자")
-    biz_no = arguments.get("biz_no", "1234104321")
-    ceo_name = arguments.get("ceo_name", "테스트대표자")
-    login_method_str = arguments.get("login_method", "corp_common_cert")
+    biz_name, biz_no, ceo_name, login_method_str = _pick(arguments, _CORP_ARG_DEFAULTS)
     
-    login_method = LoginMethod(login_method_str)
+    login_method = LoginMethod.from_value(login_method_str)
     taxpayer_info = TaxpayerInfo()
     
     # 로그인 방식에 따라 요청 데이터 생성
     if login_method == LoginMethod.CORP_COMMON_CERT:
         # 공동인증서 정보
-        common_cert = CommonCert(
-            sign_cert="base64_encoded_cert...",
-            sign_pri="base64_encoded_pri...",
-            sign_pw="cert_password",
-        )
+        common_cert = _STUB_COMMON_CERT
         
         # 1. corp_check: 공동인증서로 tin, cookies 반환
         corp_check_request = build_corp_check_request_data(
@@ -1824,60 +1810,33 @@ async def handle_scenario_build_corp_common_cert(arguments: dict[str, Any]) -> l
         )
         login_desc = "ID/PW"
     
-    corp_check_response = build_corp_check_response(
-        success=True,
-        biz_name=biz_name,
-        biz_no=biz_no,
-        ceo_name=ceo_name,
-        tin=taxpayer_info.tin,
-    )
-    
-    # 2. corp_load_calc: cookies로 법인 수집 및 계산
-    corp_load_calc_request = build_corp_load_calc_request_data(
-        cookies=corp_check_response.get("result", {}).get("cookies"),
-        export_file_prefix=taxpayer_info.tin,
-        tin=taxpayer_info.tin,
-    )
-    corp_load_calc_response = build_corp_load_calc_response(
-        success=True,
-        result_data={
-            "계산결과": {
-                "총납부세액": 0.0,
-                "미래절세효과": 0.0,
-            }
-        }
-    )
-    
+    # 2. corp_check -> corp_load_calc 성공 flow
     scenario = ScenarioConfig(
         scenario_name=f"법인_{login_desc}_{biz_name}",
         description=f"[법인] {login_desc} flow: {biz_name}의 법인 조회 시나리오",
         taxpayer_info=taxpayer_info,
         biz_type=BizType.CORP,
-        corp_check_config=ActionConfig(
-            success=True,
-            request_data=corp_check_request,
-            response_data=corp_check_response,
-        ),
-        corp_load_calc_config=ActionConfig(
-            success=True,
-            request_data=corp_load_calc_request,
-            response_data=corp_load_calc_response,
-        ),
+        **_corp_success_configs(corp_check_request, biz_name, biz_no, ceo_name, taxpayer_info),
     )
     
     return [TextContent(
         type="text",
-        text=json.dumps(scenario.to_dict(), ensure_ascii=False, indent=2)
+        text=_scenario_json(scenario)
     )]
 
 
+_SIMPLE_AUTH_FAIL_ARG_DEFAULTS = (
+    ("user_name", "테스트사용자"),
+    ("phone", "01012345678"),
+    ("birthday", "19900101"),
+    ("cert_type", "kakao"),
+    ("error_msg", ""),
+)
+
+
 async def handle_scenario_build_simple_auth_fail(arguments: dict[str, Any]) -> list[TextContent]:
     """카카오톡 간편인증 요청 실패 시나리오 생성"""
-    user_name = arguments.get("user_name", "테스트사용자")
-    phone = arguments.get("phone", "01012345678")
-    birthday = arguments.get("birthday", "19900101")
-    cert_type = arguments.get("cert_type", "kakao")
-    error_msg = arguments.get("error_msg", "")
+    user_name, phone, birthday, cert_type, error_msg = _pick(arguments, _SIMPLE_AUTH_FAIL_ARG_DEFAULTS)
     
     # 사용자 정보 생성
     user_info = UserInfo(
@@ -1908,29 +1867,38 @@ async def handle_scenario_build_simple_auth_fail(arguments: dict[str, Any]) -> l
         scenario_name=f"간편인증실패_{cert_type}_{user_name}",
         description=f"카카오톡 간편인증 요청 실패 시나리오: {user_name}",
         user_info=user_info,
-        cert_request_config=ActionConfig(
-            success=False,
-            error_type="간편인증오류",
-            error_msg=error_msg,
-            request_data=cert_request_data,
-            response_data=cert_request_response,
-        ),
+        cert_request_config=_ac(False, cert_request_data, cert_request_response, "간편인증오류", error_msg),
     )
     
     return [TextContent(
         type="text",
-        text=json.dumps(scenario.to_dict(), ensure_ascii=False, indent=2)
+        text=_scenario_json(scenario)
     )]
 
 
+# cert_response 실패 기본 메시지: 에러 타입 우선, 매칭 없으면 인증 수단별 문구
+_CERT_FAIL_MSG_BY_ERROR = {
+    "간편인증토큰만료": ERROR_MESSAGES[ErrorType.AUTH_EXPIRED],
+    "간편인증미완료": ERROR_MESSAGES[ErrorType.AUTH_NOT_COMPLETE],
+}
+_CERT_FAIL_MSG_BY_CERT = {
+    "kakao": "카카오톡 간편인증 완료 확인에 실패했습니다.",
+}
+_CERT_FAIL_MSG_FALLBACK = "네이버 간편인증 완료 확인에 실패했습니다."
+
+_CERT_RESPONSE_FAIL_ARG_DEFAULTS = (
+    ("user_name", "테스트사용자"),
+    ("phone", "01012345678"),
+    ("birthday", "19900101"),
+    ("cert_type", "kakao"),
+    ("error_type", "간편인증미완료"),
+    ("error_msg", ""),
+)
+
+
 async def handle_scenario_build_cert_response_fail(arguments: dict[str, Any]) -> list[TextContent]:
     """간편인증 완료 확인(cert_response) 실패 시나리오 생성"""
-    user_name = arguments.get("user_name", "테스트사용자")
-    phone = arguments.get("phone", "01012345678")
-    birthday = arguments.get("birthday", "19900101")
-    cert_type = arguments.get("cert_type", "kakao")
-    error_type_str = arguments.get("error_type", "간편인증미완료")
-    error_msg = arguments.get("error_msg", "")
+    user_name, phone, birthday, cert_type, error_type_str, error_msg = _pick(arguments, _CERT_RESPONSE_FAIL_ARG_DEFAULTS)
     
     # 사용자 정보 생성
     user_info = UserInfo(
@@ -1941,28 +1909,17 @@ async def handle_scenario_build_cert_response_fail(arguments: dict[str, Any]) ->
     )
     
     # cert_request는 성공 (간편인증 요청은 성공했지만 완료 확인에서 실패)
-    cert_info = CertInfo(
-        cert_type=CertType(cert_type),
-        req_tx_id="7cd3...",
-        token="eyJh...",
-        cx_id="10db...",
-    )
+    cert_info = _STUB_CERT_INFO[cert_type]
     
     # 1. cert_request: 성공
     cert_request_data = build_cert_request_data(user_info=user_info)
-    cert_request_response = build_cert_request_response(success=True, cert_info=cert_info)
+    cert_request_response = _DEFAULT_SUCCESS_RESPONSES["cert_request"]
     
-    # 기본 에러 메시지 설정
+    # 기본 에러 메시지 설정 (분기 대신 테이블 조회)
     if not error_msg:
-        if error_type_str == "간편인증토큰만료":
-            error_msg = ERROR_MESSAGES.get(ErrorType.AUTH_EXPIRED, "간편인증 토큰이 만료되었습니다.")
-        elif error_type_str == "간편인증미완료":
-            error_msg = ERROR_MESSAGES.get(ErrorType.AUTH_NOT_COMPLETE, "간편인증이 완료되지 않았습니다.")
-        else:
-            if cert_type == "kakao":
-                error_msg = "카카오톡 간편인증 완료 확인에 실패했습니다."
-            else:
-                error_msg = "네이버 간편인증 완료 확인에 실패했습니다."
+        error_msg = _CERT_FAIL_MSG_BY_ERROR.get(error_type_str) or _CERT_FAIL_MSG_BY_CERT.get(
+            cert_type, _CERT_FAIL_MSG_FALLBACK
+        )
     
     # 2. cert_response: 실패
     cert_response_data = build_cert_response_data(user_info=user_info, cert_info=cert_info)
@@ -1977,23 +1934,13 @@ async def handle_scenario_build_cert_response_fail(arguments: dict[str, Any]) ->
         description=f"간편인증 완료 확인 실패 시나리오: {user_name} ({error_type_str})",
         user_info=user_info,
         cert_info=cert_info,
-        cert_request_config=ActionConfig(
-            success=True,
-            request_data=cert_request_data,
-            response_data=cert_request_response,
-        ),
-        cert_response_config=ActionConfig(
-            success=False,
-            error_type=error_type_str,
-            error_msg=error_msg,
-            request_data=cert_response_data,
-            response_data=cert_response_response,
-        ),
+        cert_request_config=_ac(True, cert_request_data, cert_request_response),
+        cert_response_config=_ac(False, cert_response_data, cert_response_response, error_type_str, error_msg),
     )
     
     return [TextContent(
         type="text",
-        text=json.dumps(scenario.to_dict(), ensure_ascii=False, indent=2)
+        text=_scenario_json(scenario)
     )]
 
 
@@ -2001,6 +1948,26 @@ async def handle_scenario_build_cert_response_fail(arguments: dict[str, Any]) ->
 # MCP Resources
 # ============================================================================
 
+# 툴 이름 -> 핸들러 디스패치 테이블: if/elif 사다리 대신 단일 해시 조회
+_TOOL_HANDLERS: dict[str, Callable[[dict[str, Any]], Awaitable[list[TextContent]]]] = {
+    "template_list": handle_template_list,
+    "template_load": handle_template_load,
+    "scenario_build_normal": handle_scenario_build_normal,
+    "scenario_build_error": handle_scenario_build_error,
+    "scenario_build_progress": handle_scenario_build_progress,
+    "scenario_validate": handle_scenario_validate,
+    "scenario_assign": handle_scenario_assign,
+    "scenario_unassign": handle_scenario_unassign,
+    "error_types_list": handle_error_types_list,
+    "scenario_build_simple_auth": handle_scenario_build_simple_auth,
+    "scenario_build_common_cert": handle_scenario_build_common_cert,
+    "scenario_build_corp_common_cert": handle_scenario_build_corp_common_cert,
+    "scenario_build_simple_auth_fail": handle_scenario_build_simple_auth_fail,
+    "scenario_build_cert_response_fail": handle_scenario_build_cert_response_fail,
+}
+
+
+
 @server.list_resources()
 async def list_resources() -> list[Resource]:
     """List available resources."""
@@ -2024,28 +1991,10 @@ async def list_resources() -> list[Resource]:
 async def read_resource(uri: str) -> str:
     """Read a resource by URI."""
     if uri == "scenario://templates":
-        templates = load_templates()
-        result = []
-        for template_id, template_data in templates.items():
-            refund_result = template_data.get("refund_result", {})
-            result.append({
-                "template_id": template_id,
-                "description": template_data.get("description", ""),
-                "total_refund": refund_result.get("total_refund", 0),
-                "biz_type": template_data.get("biz_type", "unknown"),
-            })
-        return json.dumps({"templates": result}, ensure_ascii=False, indent=2)
+        return _templates_resource_json()
     
     elif uri == "scenario://error-types":
-        error_types = []
-        for error_type in ErrorType:
-            default_action = ERROR_DEFAULT_ACTION.get(error_type, ActionType.LOAD)
-            error_types.append({
-                "type": error_type.value,
-                "message": get_error_message(error_type),
-                "default_action": default_action.value,
-            })
-        return json.dumps({"error_types": error_types}, ensure_ascii=False, indent=2)
+        return _ERROR_TYPES_RESOURCE_JSON
     
     else:
         raise ValueError(f"Unknown resource URI: {uri}")
@@ -2055,14 +2004,27 @@ async def read_resource(uri: str) -> str:
 # Main
 # ============================================================================
 
+def _prewarm_dynamodb() -> None:
+    """DynamoDB 핸들 선생성: 서비스 모델 JSON 파싱(수백 ms)을 첫 요청 밖으로 이동"""
+    try:
+        _get_client()
+        _get_table()
+    except Exception as e:
+        # 자격 증명/리전 미설정 등은 실제 호출 시점에 핸들러가 처리
+        logger.warning("DynamoDB 프리워밍 실패 (무시하고 계속 진행): %s", e)
+
+
 async def run_server():
     """Run the MCP server."""
+    # 이벤트 루프를 막지 않도록 백그라운드 스레드에서 워밍업
+    warmup = asyncio.create_task(asyncio.to_thread(_prewarm_dynamodb))
     async with stdio_server() as (read_stream, write_stream):
         await server.run(
             read_stream,
             write_stream,
             server.create_initialization_options(),
         )
+    await warmup
 
 
 def main():
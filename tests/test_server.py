@@ -1,6 +1,8 @@
 """Tests for MCP server."""
 
 import json
+import random
+
 import pytest
 from unittest.mock import patch, MagicMock
 
@@ -8,7 +10,16 @@ from unittest.mock import patch, MagicMock
 import os
 os.environ["MOCK_ITR_LOADER_PATH"] = "/tmp/mock-itrLoader"
 
-from mock_itr_scenario_mcp.models.enums import BizType, ErrorType, ERROR_MESSAGES
+from mock_itr_scenario_mcp.models.enums import (
+    BizType,
+    ErrorType,
+    ERROR_FREQUENCY,
+    ERROR_MESSAGES,
+    ERROR_MESSAGES_ALT,
+    get_error_message,
+    pick_alt_message,
+    sample_error_type,
+)
 from mock_itr_scenario_mcp.models.scenario import (
     ScenarioConfig,
     UserInfo,
@@ -54,6 +65,18 @@ class TestModels:
         assert data["scenario_name"] == "딕셔너리 테스트"
         assert data["refund_result"]["total_refund"] == 500000
     
+    def test_scenario_to_json_bytes(self):
+        """Test ScenarioConfig.to_json_bytes() round trip."""
+        scenario = ScenarioConfig(
+            scenario_name="바이트 직렬화 테스트",
+            refund_result=RefundResult(total_refund=250000),
+        )
+
+        encoded = scenario.to_json_bytes()
+
+        assert isinstance(encoded, bytes)
+        assert json.loads(encoded) == scenario.to_dict()
+
     def test_scenario_from_dict(self):
         """Test ScenarioConfig.from_dict()."""
         data = {
@@ -89,6 +112,49 @@ class TestEnums:
         assert ERROR_MESSAGES[ErrorType.NO_BIZ] == "사업자 등록 정보가 없습니다."
 
 
+class _FixedRandom(random.Random):
+    """Test RNG whose random() returns a preset value."""
+
+    def __init__(self, value: float):
+        super().__init__()
+        self._value = value
+
+    def random(self) -> float:
+        return self._value
+
+
+class TestErrorSampling:
+    """Test frequency-weighted error-type and message sampling."""
+
+    def test_sample_error_type_boundaries(self):
+        """Draws on either side of a cumulative-weight boundary land on the right member."""
+        # Cumulative weights: (16338, 16546, ..., 16673)
+        assert sample_error_type(_FixedRandom(0.0)) == ErrorType.NO_BIZ
+        assert sample_error_type(_FixedRandom(16337.5 / 16673)) == ErrorType.NO_BIZ
+        assert sample_error_type(_FixedRandom(16338.5 / 16673)) == ErrorType.ALREADY_REFUNDED
+        assert sample_error_type(_FixedRandom(16672.5 / 16673)) == ErrorType.CALC_ERROR
+
+    def test_sample_error_type_seeded(self):
+        """Seeded draws only produce members from the frequency table."""
+        rng = random.Random(42)
+        draws = {sample_error_type(rng) for _ in range(200)}
+        assert draws <= set(ERROR_FREQUENCY)
+        # NO_BIZ covers ~98% of the weight, so it always shows up in 200 draws
+        assert ErrorType.NO_BIZ in draws
+
+    def test_pick_alt_message_boundaries(self):
+        """Alternate-message draws follow the per-type cumulative weights."""
+        alts = ERROR_MESSAGES_ALT[ErrorType.NO_BIZ]
+        # Cumulative weights: (10140, 13417, 16332)
+        assert pick_alt_message(ErrorType.NO_BIZ, _FixedRandom(0.0)) == alts[0]
+        assert pick_alt_message(ErrorType.NO_BIZ, _FixedRandom(10140.5 / 16332)) == alts[1]
+        assert pick_alt_message(ErrorType.NO_BIZ, _FixedRandom(16331.5 / 16332)) == alts[2]
+
+    def test_pick_alt_message_without_variants(self):
+        """Error types without variants fall back to the default message."""
+        assert pick_alt_message(ErrorType.AUTH_EXPIRED) == get_error_message(ErrorType.AUTH_EXPIRED)
+
+
 class TestScenarioBuilder:
     """Test scenario building functions."""
     